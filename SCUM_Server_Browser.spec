@@ -40,8 +40,6 @@ a = Analysis(
         'matplotlib.pyplot',
         'matplotlib.backends.backend_qtagg',
         'matplotlib.figure',
-        'scipy',
-        'scipy.interpolate',
         'numpy',
         'darkdetect',
     ] + pyqt6_hiddenimports + qt6_hiddenimports + sip_hiddenimports + collect_submodules('PyQt6') + collect_submodules('scum_tracker'),
@@ -5,6 +5,7 @@ Captures screenshots in both light and dark themes for documentation.
 """
 import sys
 import os
+import logging
 import platform
 from pathlib import Path
 
@@ -12,37 +13,72 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QCoreApplication, QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter
 from scum_tracker.ui.main_window import MainWindow
 from scum_tracker.services.theme_service import ThemeService, Theme
 
+log = logging.getLogger(__name__)
+
+
+class _SaveSignals(QObject):
+    """Signals for _SaveTask (QRunnable is not a QObject)."""
+    finished = pyqtSignal(str, bool)  # filepath, success
+
+
+class _SaveTask(QRunnable):
+    """Encodes and writes a screenshot off the GUI thread."""
+    
+    def __init__(self, image, filepath: str, quality: int):
+        super().__init__()
+        self.setAutoDelete(False)  # ScreenshotCapture holds on to it until finished
+        self.image = image
+        self.filepath = filepath
+        self.quality = quality
+        self.signals = _SaveSignals()
+    
+    def run(self):
+        success = self.image.save(self.filepath, "PNG", self.quality)
+        self.signals.finished.emit(self.filepath, success)
+
 
 class ScreenshotCapture:
     """Captures application screenshots in different themes."""
     
+    # Capture anyway if the window hasn't signalled ready by then (ms)
+    READY_TIMEOUT_MS = 30000
+    
+    # Qt maps PNG quality to zlib level as (100 - quality) * 9 / 91, so 65 is
+    # level 3: much faster to encode than the default 6 for a slightly larger file
+    PNG_QUALITY = 65
+    
     def __init__(self):
-        print("  Creating QApplication...")
+        log.debug("Creating QApplication...")
+        # Share GL contexts so repeated renders don't set up a new one each time
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("SCUM Server Browser")
         self.screenshots_dir = Path(__file__).parent.parent / "screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
-        print(f"  Screenshots directory: {self.screenshots_dir}")
+        log.debug("Screenshots directory: %s", self.screenshots_dir)
         
         # Determine platform prefix
         self.platform_prefix = "win" if platform.system() == "Windows" else "linux"
-        print(f"  Platform prefix: {self.platform_prefix}")
+        log.debug("Platform prefix: %s", self.platform_prefix)
         
         self.themes_to_capture = [
             (Theme.DARK, "dark"),
             (Theme.LIGHT, "light")
         ]
         self.current_theme_index = 0
-        print("  ScreenshotCapture initialized")
+        self._capture_started = False
+        self._save_tasks = []  # Screenshots still being encoded in the thread pool
+        self._save_failed = False
+        log.debug("ScreenshotCapture initialized")
     
     def capture_screenshots(self):
         """Capture screenshots for all themes."""
-        print("\nCreating MainWindow...")
+        log.info("Creating MainWindow...")
         
         try:
             # Set screenshot mode
@@ -50,35 +86,49 @@ class ScreenshotCapture:
             
             # Create window once
             self.window = MainWindow()
+            self.window.ready.connect(self._start_capture)
             self.window.show()
             
-            # Wait for initial load, then start capturing
-            print("Waiting for window to render and load...")
-            QTimer.singleShot(5000, self._capture_current_theme)
+            # Start capturing as soon as the server list is displayed
+            log.info("Waiting for window to render and load...")
+            QTimer.singleShot(self.READY_TIMEOUT_MS, self._on_ready_timeout)
             
         except Exception as e:
-            print(f"✗ Error creating window: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error creating window: %s", e)
             self.app.exit(1)
     
+    def _start_capture(self):
+        """Begin capturing themes (once)."""
+        if self._capture_started:
+            return
+        self._capture_started = True
+        self._capture_current_theme()
+    
+    def _on_ready_timeout(self):
+        """Fallback if the server list never finished loading."""
+        if not self._capture_started:
+            log.warning("Window not ready in time, capturing anyway...")
+            self._start_capture()
+    
     def _capture_current_theme(self):
         """Capture screenshot for current theme."""
         try:
             theme, theme_name = self.themes_to_capture[self.current_theme_index]
-            print(f"\nCapturing {theme_name} theme screenshot...")
+            log.info("Capturing %s theme screenshot...", theme_name)
             
             # Apply theme by calling the window's theme setter
-            print(f"  Applying {theme_name} theme...")
+            log.debug("Applying %s theme...", theme_name)
             self.window._set_theme(theme)
             
-            # Wait a moment for theme to apply, then take screenshot
-            QTimer.singleShot(1000, lambda: self._take_screenshot(theme_name))
+            # Repolish now so the new stylesheet is in effect for the render,
+            # then give queued paint events a short moment to settle
+            style = self.window.style()
+            style.unpolish(self.window)
+            style.polish(self.window)
+            QTimer.singleShot(200, lambda: self._take_screenshot(theme_name))
             
         except Exception as e:
-            print(f"✗ Error in _capture_current_theme: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in _capture_current_theme: %s", e)
             self.app.exit(1)
     
     def _take_screenshot(self, theme_name: str):
@@ -88,54 +138,66 @@ class ScreenshotCapture:
             is_offscreen = os.environ.get('QT_QPA_PLATFORM', '') in ['offscreen', 'minimal']
             
             if is_offscreen:
-                # For offscreen rendering, render to pixmap directly
-                from PyQt6.QtGui import QPixmap, QPainter
-                
-                # Get window size
+                # The offscreen plugin backs a QPixmap with a QImage anyway, so
+                # render straight into one. A fresh image per theme, since the
+                # previous one may still be encoding in the thread pool
                 size = self.window.size()
-                pixmap = QPixmap(size)
+                image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+                image.fill(Qt.GlobalColor.transparent)
                 
-                # Render window to pixmap
-                self.window.render(pixmap)
-                print(f"  Rendered offscreen: {size.width()}x{size.height()}")
+                painter = QPainter(image)
+                self.window.render(painter)
+                painter.end()
+                log.debug("Rendered offscreen: %dx%d", size.width(), size.height())
             else:
                 # Normal window grab for platforms with display
-                pixmap = self.window.grab()
+                image = self.window.grab().toImage()
             
-            # Save screenshot with platform-specific name
+            # Save screenshot with platform-specific name. QImage can be used
+            # from another thread, so encode it in the pool while the next
+            # theme renders
             filename = f"screenshot-{self.platform_prefix}-{theme_name}.png"
             filepath = self.screenshots_dir / filename
             
-            if pixmap.save(str(filepath)):
-                print(f"✓ Saved: {filepath}")
-            else:
-                print(f"✗ Failed to save: {filepath}")
-                raise Exception(f"Failed to save pixmap to {filepath}")
+            task = _SaveTask(image, str(filepath), self.PNG_QUALITY)
+            task.signals.finished.connect(self._on_save_finished)
+            self._save_tasks.append(task)
+            QThreadPool.globalInstance().start(task)
             
-            # Move to next theme or quit
+            # Move to next theme, or wait for the remaining saves to finish
             self.current_theme_index += 1
             if self.current_theme_index < len(self.themes_to_capture):
                 # Capture next theme on same window
-                QTimer.singleShot(500, self._capture_current_theme)
-            else:
-                print("\n✓ All screenshots captured successfully!")
-                # Close window and quit app
-                self.window.close()
-                QTimer.singleShot(100, self.app.quit)
+                QTimer.singleShot(0, self._capture_current_theme)
                 
         except Exception as e:
-            print(f"✗ Error capturing screenshot: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error capturing screenshot: %s", e)
             self.app.exit(1)
     
+    def _on_save_finished(self, filepath: str, success: bool):
+        """Handle a finished background save; quit once all are done."""
+        self._save_tasks = [t for t in self._save_tasks if t.filepath != filepath]
+        if success:
+            log.info("Saved: %s", filepath)
+        else:
+            log.error("Failed to save: %s", filepath)
+            self._save_failed = True
+        
+        if self._save_tasks or self.current_theme_index < len(self.themes_to_capture):
+            return
+        
+        # Closing the last window quits the app, so only do it once saves are done
+        self.window.close()
+        if self._save_failed:
+            self.app.exit(1)
+        else:
+            log.info("All screenshots captured successfully!")
+            QTimer.singleShot(100, self.app.quit)
+    
     def run(self):
         """Run the screenshot capture process."""
-        print(f"SCUM Server Browser Screenshot Capture")
-        print(f"Platform: {platform.system()}")
-        print(f"QT_QPA_PLATFORM: {os.environ.get('QT_QPA_PLATFORM', 'default')}")
-        print(f"Output directory: {self.screenshots_dir}")
-        print(f"Capturing {len(self.themes_to_capture)} screenshots...\n")
+        log.info("Output directory: %s", self.screenshots_dir)
+        log.info("Capturing %d screenshots...", len(self.themes_to_capture))
         
         # Start capturing
         self.capture_screenshots()
@@ -146,25 +208,27 @@ class ScreenshotCapture:
 
 def main():
     """Main entry point."""
-    print("Starting screenshot capture script...")
-    print(f"Python version: {sys.version}")
-    print(f"Platform: {platform.system()}")
-    print(f"QT_QPA_PLATFORM: {os.environ.get('QT_QPA_PLATFORM', 'not set')}")
+    verbose = '--verbose' in sys.argv or '-v' in sys.argv
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(levelname)s: %(message)s"
+    )
+    
+    log.info("SCUM Server Browser Screenshot Capture")
+    log.debug("Python version: %s", sys.version)
+    log.info("Platform: %s", platform.system())
+    log.info("QT_QPA_PLATFORM: %s", os.environ.get('QT_QPA_PLATFORM', 'not set'))
     
     try:
-        print("\nInitializing ScreenshotCapture...")
         capture = ScreenshotCapture()
-        print("Running capture...")
         result = capture.run()
-        print(f"Capture completed with result: {result}")
+        log.debug("Capture completed with result: %s", result)
         sys.exit(result)
     except KeyboardInterrupt:
-        print("\n\nScreenshot capture cancelled.")
+        log.warning("Screenshot capture cancelled.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n✗ Fatal error in main: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Fatal error in main: %s", e)
         sys.exit(1)
 
 
@@ -4,35 +4,27 @@ SCUM Server Tracker - Main Application
 import sys
 import os
 import platform
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import QSize
-from scum_tracker.ui.main_window import MainWindow
-from scum_tracker.services.theme_service import ThemeService
 
 
 def _init_windows_optimizations():
     """Initialize Windows-specific optimizations for better performance"""
     if platform.system() == 'Windows':
         try:
-            # Enable DPI awareness for sharper rendering on high-DPI displays
+            # Enable per-monitor DPI awareness for sharper rendering on high-DPI
+            # displays (Windows 10 1703+, which Qt6 requires anyway)
             import ctypes
-            try:
-                # Try to set DPI awareness (Windows 8.1+)
-                ctypes.windll.shcore.SetProcessDpiAwareness(1)
-            except:
-                try:
-                    # Fallback for older Windows versions
-                    ctypes.windll.user32.SetProcessDPIAware()
-                except:
-                    pass
-            
-            # Optimize socket performance on Windows
-            import socket
-            if hasattr(socket, 'setdefaulttimeout'):
-                # Set a reasonable default timeout for all sockets
-                socket.setdefaulttimeout(10)
-                
+            from ctypes import wintypes
+            ERROR_ACCESS_DENIED = 5  # Awareness was already set (e.g. by the exe manifest)
+            DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = ctypes.c_void_p(-4)
+            user32 = ctypes.WinDLL('user32', use_last_error=True)
+            set_awareness = user32.SetProcessDpiAwarenessContext
+            set_awareness.argtypes = [ctypes.c_void_p]
+            set_awareness.restype = wintypes.BOOL
+            # Failure is reported through the BOOL result, not an exception
+            if not set_awareness(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2):
+                error = ctypes.get_last_error()
+                if error != ERROR_ACCESS_DENIED:
+                    print(f"Could not set DPI awareness: {ctypes.FormatError(error)}")
         except Exception as e:
             print(f"Windows optimization warning: {e}")
 
@@ -71,6 +63,12 @@ def main():
     # Apply Windows-specific optimizations early
     _init_windows_optimizations()
     
+    # Qt is only needed for the GUI, so keep it out of the CLI paths above
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QIcon
+    from scum_tracker.ui.main_window import MainWindow
+    from scum_tracker.services.theme_service import ThemeService
+    
     app = QApplication(sys.argv)
     
     # Set application name and icon for taskbar and window manager
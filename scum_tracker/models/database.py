@@ -3,47 +3,72 @@ Database layer for storing favorites and ping history
 """
 import sqlite3
 import json
-import platform
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from scum_tracker.models.server import PingRecord
 
 
 class Database:
     """SQLite database manager"""
 
+    # Kept as a single string so every insert hits sqlite3's statement cache
+    INSERT_PING_SQL = (
+        "INSERT INTO ping_history (server_id, latency, timestamp, success, error_message) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+
     def __init__(self, db_path: Optional[str] = None):
         if db_path is None:
             db_path = str(Path.home() / ".scum_tracker" / "data.db")
         
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
+        
+        # One connection for the lifetime of the Database, shared by the UI
+        # and worker threads - the lock serializes access to it
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._favorites_cache: Optional[Set[str]] = None  # Loaded on first use
         self._init_db()
 
-    def _get_connection(self):
-        """Get a database connection with optimizations for Windows"""
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection with performance optimizations"""
+        conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Rows support both name and index access
         
         # Apply performance optimizations
-        if platform.system() == 'Windows':
-            # Windows-specific optimizations
-            conn.execute('PRAGMA journal_mode=WAL')  # Write-Ahead Logging for better concurrency
-            conn.execute('PRAGMA synchronous=NORMAL')  # Faster writes, still safe
-            conn.execute('PRAGMA temp_store=MEMORY')  # Use memory for temp tables
-            conn.execute('PRAGMA cache_size=10000')  # Larger cache (10MB)
-        else:
-            # Linux optimizations
-            conn.execute('PRAGMA journal_mode=WAL')
-            conn.execute('PRAGMA synchronous=FULL')
+        conn.execute('PRAGMA page_size=8192')  # Only takes effect on a new, empty database
+        conn.execute('PRAGMA journal_mode=WAL')  # Write-Ahead Logging for better concurrency
+        conn.execute('PRAGMA synchronous=NORMAL')  # Faster writes; a crash can only lose the last few pings
+        conn.execute('PRAGMA temp_store=MEMORY')  # Use memory for temp tables
+        conn.execute('PRAGMA cache_size=-20000')  # Page cache of ~20MB (negative = KiB)
+        conn.execute('PRAGMA mmap_size=268435456')  # Read pages through a 256MB memory map
+        conn.execute('PRAGMA secure_delete=OFF')  # Don't zero freed pages; nothing here is secret
         
         return conn
 
+    @contextmanager
+    def _get_connection(self):
+        """Use the shared connection in a transaction (committed on success)"""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self):
         """Initialize database schema"""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
+            # Older databases stored ping timestamps as ISO text
+            migrate_timestamps = self._prepare_timestamp_migration(cursor)
+            
             # Favorites table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS favorites (
@@ -59,7 +84,7 @@ class Database:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     server_id TEXT,
                     latency INTEGER,
-                    timestamp TIMESTAMP,
+                    timestamp INTEGER,  -- Unix epoch seconds
                     success BOOLEAN,
                     error_message TEXT,
                     FOREIGN KEY (server_id) REFERENCES favorites(server_id)
@@ -85,10 +110,32 @@ class Database:
                 )
             """)
             
+            if migrate_timestamps:
+                # Stored text is local time; the 'utc' modifier converts it before
+                # taking the epoch
+                cursor.execute("""
+                    INSERT INTO ping_history (id, server_id, latency, timestamp, success, error_message)
+                    SELECT id, server_id, latency,
+                           CAST(strftime('%s', timestamp, 'utc') AS INTEGER),
+                           success, error_message
+                    FROM ping_history_old
+                """)
+                cursor.execute("DROP TABLE ping_history_old")
+            
             conn.commit()
+
+    def _prepare_timestamp_migration(self, cursor) -> bool:
+        """Move an old TIMESTAMP-typed ping_history aside so it can be recreated"""
+        cursor.execute("PRAGMA table_info(ping_history)")
+        column_types = {row["name"]: row["type"].upper() for row in cursor.fetchall()}
+        if column_types.get('timestamp') != 'TIMESTAMP':
+            return False
         
-        # Clean up old records on startup (keep last 24 hours)
-        self.cleanup_old_records(days=1)
+        # Indexes follow a renamed table, so drop them to let them be rebuilt
+        cursor.execute("DROP INDEX IF EXISTS idx_ping_server_timestamp")
+        cursor.execute("DROP INDEX IF EXISTS idx_ping_timestamp")
+        cursor.execute("ALTER TABLE ping_history RENAME TO ping_history_old")
+        return True
 
     def add_favorite(self, server_id: str, server_name: str) -> bool:
         """Add a server to favorites"""
@@ -100,6 +147,8 @@ class Database:
                     (server_id, server_name)
                 )
                 conn.commit()
+            if self._favorites_cache is not None:
+                self._favorites_cache.add(server_id)
             return True
         except Exception as e:
             print(f"Error adding favorite: {e}")
@@ -112,44 +161,65 @@ class Database:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM favorites WHERE server_id = ?", (server_id,))
                 conn.commit()
+            if self._favorites_cache is not None:
+                self._favorites_cache.discard(server_id)
             return True
         except Exception as e:
             print(f"Error removing favorite: {e}")
             return False
 
+    def _load_favorites(self) -> Set[str]:
+        """Get the cached set of favorite server IDs, reading it once from the DB"""
+        if self._favorites_cache is None:
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT server_id FROM favorites")
+                    self._favorites_cache = {row[0] for row in cursor.fetchall()}
+            except Exception as e:
+                print(f"Error fetching favorites: {e}")
+                return set()
+        return self._favorites_cache
+
     def get_favorites(self) -> List[str]:
         """Get list of favorite server IDs"""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT server_id FROM favorites")
-                return [row[0] for row in cursor.fetchall()]
-        except Exception as e:
-            print(f"Error fetching favorites: {e}")
-            return []
+        return list(self._load_favorites())
 
     def is_favorite(self, server_id: str) -> bool:
         """Check if a server is in favorites"""
-        return server_id in self.get_favorites()
+        return server_id in self._load_favorites()
+
+    @staticmethod
+    def _ping_params(record: PingRecord) -> tuple:
+        """Get the INSERT_PING_SQL parameters for a ping record"""
+        return (record.server_id, record.latency, int(record.timestamp.timestamp()),
+                record.success, record.error_message)
 
     def add_ping_record(self, record: PingRecord) -> bool:
         """Add a ping record to history"""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """INSERT INTO ping_history 
-                       (server_id, latency, timestamp, success, error_message) 
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (record.server_id, record.latency, record.timestamp, 
-                     record.success, record.error_message)
-                )
+                conn.execute(self.INSERT_PING_SQL, self._ping_params(record))
                 conn.commit()
             return True
         except Exception as e:
             print(f"Error adding ping record: {e}")
             return False
 
+    def add_ping_records(self, records: List[PingRecord]) -> bool:
+        """Add several ping records to history in a single transaction"""
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    self.INSERT_PING_SQL,
+                    [self._ping_params(record) for record in records]
+                )
+                conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error adding ping records: {e}")
+            return False
+
     def get_ping_history(self, server_id: str, limit: int = 100) -> List[PingRecord]:
         """Get ping history for a server (last N records)"""
         try:
@@ -159,70 +229,70 @@ class Database:
                     """SELECT server_id, latency, timestamp, success, error_message 
                        FROM ping_history 
                        WHERE server_id = ? 
-                       ORDER BY timestamp DESC 
+                       ORDER BY timestamp DESC, id DESC 
                        LIMIT ?""",
                     (server_id, limit)
                 )
-                records = []
-                for row in cursor.fetchall():
-                    records.append(PingRecord(
-                        server_id=row[0],
-                        latency=row[1],
-                        timestamp=datetime.fromisoformat(row[2]),
-                        success=bool(row[3]),
-                        error_message=row[4]
-                    ))
-                return records
+                return [
+                    PingRecord(
+                        server_id=row["server_id"],
+                        latency=row["latency"],
+                        timestamp=datetime.fromtimestamp(row["timestamp"]),
+                        success=bool(row["success"]),
+                        error_message=row["error_message"]
+                    )
+                    for row in cursor
+                ]
         except Exception as e:
             print(f"Error getting ping history: {e}")
             return []
 
-    def get_all_ping_history_stats(self, limit: int = 100) -> dict:
-        """Get ping stats (min/max/avg) for all servers efficiently"""
+    def get_all_ping_history_stats(self, limit: int = 100,
+                                   server_ids: Optional[List[str]] = None) -> dict:
+        """
+        Get ping stats (min/max/avg) over the last N pings of every server
+        
+        Args:
+            limit: Number of most recent successful pings to aggregate per server
+            server_ids: Only aggregate these servers (all servers if None)
+        """
         try:
             stats = {}
+            server_filter = ""
+            params = []
+            if server_ids is not None:
+                if not server_ids:
+                    return stats
+                server_filter = f"AND server_id IN ({','.join('?' * len(server_ids))})"
+                params = list(server_ids)
+            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                # Optimized query using indexes
+                # Aggregate in SQLite; the window ranks each server's pings
+                # newest first using idx_ping_server_timestamp
                 cursor.execute(f"""
-                    SELECT server_id, latency, timestamp FROM ping_history 
-                    WHERE latency > 0
-                    ORDER BY server_id, timestamp DESC
-                """)
-                
-                current_server = None
-                latencies = []
-                last_timestamp = None
-                
-                for row in cursor.fetchall():
-                    server_id, latency, timestamp = row
-                    
-                    if server_id != current_server:
-                        # Store stats for previous server
-                        if current_server and latencies:
-                            stats[current_server] = {
-                                'min': min(latencies),
-                                'max': max(latencies),
-                                'avg': sum(latencies) / len(latencies),
-                                'count': len(latencies),
-                                'last_timestamp': last_timestamp
-                            }
-                        
-                        current_server = server_id
-                        latencies = []
-                        last_timestamp = datetime.fromisoformat(timestamp) if timestamp else None
-                    
-                    if len(latencies) < limit:
-                        latencies.append(latency)
+                    WITH ranked AS (
+                        SELECT server_id, latency, timestamp,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY server_id ORDER BY timestamp DESC, id DESC
+                               ) AS rn
+                        FROM ping_history
+                        WHERE latency > 0 {server_filter}
+                    )
+                    SELECT server_id, MIN(latency), MAX(latency), AVG(latency),
+                           COUNT(*), MAX(timestamp)
+                    FROM ranked
+                    WHERE rn <= ?
+                    GROUP BY server_id
+                """, params + [limit])
                 
-                # Don't forget the last server
-                if current_server and latencies:
-                    stats[current_server] = {
-                        'min': min(latencies),
-                        'max': max(latencies),
-                        'avg': sum(latencies) / len(latencies),
-                        'count': len(latencies),
-                        'last_timestamp': last_timestamp
+                for server_id, min_lat, max_lat, avg_lat, count, last_timestamp in cursor.fetchall():
+                    stats[server_id] = {
+                        'min': min_lat,
+                        'max': max_lat,
+                        'avg': avg_lat,
+                        'count': count,
+                        'last_timestamp': datetime.fromtimestamp(last_timestamp) if last_timestamp else None
                     }
             
             return stats
@@ -233,12 +303,12 @@ class Database:
     def cleanup_old_records(self, days: int = 1) -> int:
         """Delete ping records older than N days. Returns number of deleted records."""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff = int((datetime.now() - timedelta(days=days)).timestamp())
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "DELETE FROM ping_history WHERE timestamp < ?",
-                    (cutoff_date,)
+                    (cutoff,)
                 )
                 deleted_count = cursor.rowcount
                 conn.commit()
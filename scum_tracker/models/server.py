@@ -1,12 +1,19 @@
 """
 Data models for SCUM servers
 """
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
+import numpy as np
 
-@dataclass
+# Hundreds of servers and ping records are kept in memory; slots drop the
+# per-instance __dict__ (dataclass slots support needs Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class GameServer:
     """Represents a SCUM game server"""
     id: str
@@ -26,7 +33,7 @@ class GameServer:
         return f"{self.name} ({self.players}/{self.max_players})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PingRecord:
     """Represents a ping measurement"""
     server_id: str
@@ -34,3 +41,49 @@ class PingRecord:
     timestamp: datetime = field(default_factory=datetime.now)
     success: bool = True
     error_message: Optional[str] = None
+
+
+@dataclass
+class ServerTable:
+    """Column-oriented (one NumPy array per field) view of a server list for bulk analysis"""
+    ids: np.ndarray
+    ips: np.ndarray
+    ports: np.ndarray
+    countries: np.ndarray
+    pings: np.ndarray  # 0 where the server hasn't been pinged
+    names_lower: np.ndarray  # Lowercased names, for case-insensitive search
+    players: np.ndarray
+    max_players: np.ndarray
+    favorites: np.ndarray
+    rows: Dict[str, int]  # server id -> row, for keeping pings/favorites current
+
+    @classmethod
+    def from_servers(cls, servers: List[GameServer]) -> "ServerTable":
+        """Build a table from GameServer objects (in the same order)"""
+        return cls(
+            ids=np.array([s.id for s in servers], dtype=object),
+            ips=np.array([s.ip for s in servers], dtype=object),
+            ports=np.array([s.port for s in servers], dtype=np.int32),
+            countries=np.array([s.region for s in servers], dtype=object),
+            pings=np.array([s.latency or 0 for s in servers], dtype=np.int32),
+            names_lower=np.array([s.name.lower() for s in servers], dtype=str),
+            players=np.array([s.players for s in servers], dtype=np.int32),
+            max_players=np.array([s.max_players for s in servers], dtype=np.int32),
+            favorites=np.array([s.is_favorite for s in servers], dtype=bool),
+            rows={s.id: row for row, s in enumerate(servers)},
+        )
+
+    def set_ping(self, server_id: str, latency: int) -> None:
+        """Record a server's new latency (0 for a failed ping)"""
+        row = self.rows.get(server_id)
+        if row is not None:
+            self.pings[row] = latency
+
+    def set_favorite(self, server_id: str, is_favorite: bool) -> None:
+        """Record a server's new favorite status"""
+        row = self.rows.get(server_id)
+        if row is not None:
+            self.favorites[row] = is_favorite
+
+    def __len__(self) -> int:
+        return len(self.ids)
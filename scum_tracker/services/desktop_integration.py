@@ -2,22 +2,41 @@
 Desktop integration for Linux systems
 Creates .desktop files and installs icons for application menu integration
 """
+import hashlib
 import os
 import sys
 import platform
 import shutil
+import tempfile
 from pathlib import Path
+from string import Template
 
 
 class DesktopIntegration:
     """Handle desktop environment integration on Linux"""
     
+    DESKTOP_TEMPLATE = Template("""[Desktop Entry]
+Version=1.0
+Type=Application
+Name=SCUM Server Browser
+Comment=Track and ping SCUM game servers with real-time latency monitoring
+Exec=$exe_path
+Path=$working_dir
+Icon=scum-server-browser
+Terminal=false
+Categories=Game;Network;
+Keywords=scum;server;browser;game;ping;
+StartupWMClass=scum_tracker
+""")
+    
     def __init__(self):
         self.home = Path.home()
         self.local_share = self.home / ".local" / "share"
         self.bin_dir = self.home / ".local" / "bin"
         self.desktop_dir = self.local_share / "applications"
         self.icon_dir = self.local_share / "icons" / "hicolor"
+        # Hash of the last installed desktop file + icon, to skip cache rebuilds
+        self.install_stamp = self.local_share / "scum-server-browser" / ".install-stamp"
         
     def is_linux(self):
         """Check if running on Linux"""
@@ -61,17 +80,53 @@ class DesktopIntegration:
             
             exe_path = self.get_executable_path()
             icon_path = self.get_icon_path()
+            icon_sizes = [48, 64, 128, 256]
+            icon_dests = [
+                self.icon_dir / f"{size}x{size}" / "apps" / "scum-server-browser.png"
+                for size in icon_sizes
+            ]
+            
+            # Same icon for all sizes for now, so read it once
+            icon_data = icon_path.read_bytes() if icon_path and icon_path.exists() else b""
+            
+            # Set working directory to executable's directory
+            desktop_content = self.DESKTOP_TEMPLATE.substitute(
+                exe_path=exe_path,
+                working_dir=exe_path.parent
+            )
+            desktop_file = self.desktop_dir / "scum-server-browser.desktop"
             
-            # Install icon if available
-            if icon_path and icon_path.exists():
-                icon_sizes = [48, 64, 128, 256]
-                for size in icon_sizes:
-                    icon_dest_dir = self.icon_dir / f"{size}x{size}" / "apps"
-                    icon_dest_dir.mkdir(parents=True, exist_ok=True)
-                    icon_dest = icon_dest_dir / "scum-server-browser.png"
-                    
-                    # Copy icon (we'll use the same icon for all sizes for now)
-                    shutil.copy2(icon_path, icon_dest)
+            # A reinstall of the same files doesn't need the caches rebuilt
+            install_hash = hashlib.sha256(desktop_content.encode() + icon_data).hexdigest()
+            previously_installed = desktop_file.exists() and (
+                not icon_data or all(dest.exists() for dest in icon_dests)
+            )
+            unchanged = previously_installed and self._read_install_stamp() == install_hash
+            
+            # Write everything into a staging directory first, then move each
+            # file into place. The staging directory is under local_share so the
+            # renames stay on one filesystem and are atomic, and a failed
+            # install doesn't leave half-written files behind.
+            with tempfile.TemporaryDirectory(dir=self.local_share, prefix=".scum-server-browser-") as staging:
+                staging = Path(staging)
+                staged_files = []
+                
+                if icon_data:
+                    for size, icon_dest in zip(icon_sizes, icon_dests):
+                        staged_icon = staging / f"icon-{size}.png"
+                        staged_icon.write_bytes(icon_data)
+                        shutil.copystat(icon_path, staged_icon)
+                        staged_files.append((staged_icon, icon_dest))
+                
+                staged_desktop = staging / desktop_file.name
+                staged_desktop.write_text(desktop_content)
+                # Desktop files should be readable, not executable (0o644)
+                staged_desktop.chmod(0o644)
+                staged_files.append((staged_desktop, desktop_file))
+                
+                for staged_file, dest in staged_files:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(staged_file, dest)
             
             # Create symlink in bin directory for command-line access
             bin_link = self.bin_dir / "scum-server-browser"
@@ -79,31 +134,11 @@ class DesktopIntegration:
                 bin_link.unlink()
             bin_link.symlink_to(exe_path)
             
-            # Create .desktop file
-            # Set working directory to executable's directory
-            working_dir = exe_path.parent
-            
-            desktop_content = f"""[Desktop Entry]
-Version=1.0
-Type=Application
-Name=SCUM Server Browser
-Comment=Track and ping SCUM game servers with real-time latency monitoring
-Exec={exe_path}
-Path={working_dir}
-Icon=scum-server-browser
-Terminal=false
-Categories=Game;Network;
-Keywords=scum;server;browser;game;ping;
-StartupWMClass=scum_tracker
-"""
-            desktop_file = self.desktop_dir / "scum-server-browser.desktop"
-            desktop_file.write_text(desktop_content)
-            # Desktop files should be readable, not executable (0o644)
-            desktop_file.chmod(0o644)
-            
             # Update desktop database
-            self._update_desktop_database()
-            self._update_icon_cache()
+            if not unchanged:
+                self._update_desktop_database()
+                self._update_icon_cache()
+                self._write_install_stamp(install_hash)
             
             return True, "Desktop entry created successfully!\n\nThe application is now available in your application menu (Games category).\nYou can also run 'scum-server-browser' from the terminal."
             
@@ -133,6 +168,9 @@ StartupWMClass=scum_tracker
                 if icon_file.exists():
                     icon_file.unlink()
             
+            if self.install_stamp.exists():
+                self.install_stamp.unlink()
+            
             # Update desktop database
             self._update_desktop_database()
             self._update_icon_cache()
@@ -142,34 +180,70 @@ StartupWMClass=scum_tracker
         except Exception as e:
             return False, f"Failed to remove desktop entry: {str(e)}"
     
-    def _update_desktop_database(self):
-        """Update the desktop database cache"""
+    def _read_install_stamp(self):
+        """Get the hash recorded by the last install, or None"""
+        try:
+            return self.install_stamp.read_text().strip()
+        except OSError:
+            return None
+    
+    def _write_install_stamp(self, install_hash):
+        """Record the hash of the files just installed"""
+        try:
+            self.install_stamp.parent.mkdir(parents=True, exist_ok=True)
+            self.install_stamp.write_text(install_hash)
+        except OSError:
+            pass  # Only costs a cache rebuild on the next install
+    
+    def _run_detached(self, args):
+        """
+        Start a cache rebuild command without waiting for it to finish
+        
+        The command is started from a short-lived sh that backgrounds it and
+        exits, and that sh is reaped right away. The command itself ends up
+        parented to init, which reaps it, so no zombie or unwaited Popen is
+        left behind in this process.
+        
+        Raises:
+            FileNotFoundError: If the command isn't installed
+        """
+        import subprocess
+        program = shutil.which(args[0])
+        if program is None:
+            raise FileNotFoundError(args[0])
         try:
-            import subprocess
             subprocess.run(
-                ['update-desktop-database', str(self.desktop_dir)],
-                capture_output=True,
+                ['sh', '-c', '"$@" &', 'sh', program, *args[1:]],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
                 timeout=5
             )
-            # KDE-specific: rebuild system configuration cache
-            # Try KDE6 first, then KDE5
-            for cmd in ['kbuildsycoca6', 'kbuildsycoca5']:
-                try:
-                    subprocess.run([cmd], capture_output=True, timeout=10)
-                    break
-                except:
-                    continue
-        except:
+        except subprocess.TimeoutExpired:
+            pass  # sh only backgrounds the command, so it has started by now
+    
+    def _update_desktop_database(self):
+        """Update the desktop database cache"""
+        # Desktop environments also watch applications/ themselves, so these
+        # are fired off in the background rather than waited on
+        try:
+            self._run_detached(['update-desktop-database', str(self.desktop_dir)])
+        except OSError:
             pass  # Not critical if this fails
+        
+        # KDE-specific: rebuild system configuration cache
+        # Try KDE6 first, then KDE5 (a missing command fails immediately)
+        for cmd in ['kbuildsycoca6', 'kbuildsycoca5']:
+            try:
+                self._run_detached([cmd])
+                break
+            except OSError:
+                continue
     
     def _update_icon_cache(self):
         """Update the icon cache"""
         try:
-            import subprocess
-            subprocess.run(
-                ['gtk-update-icon-cache', '-f', '-t', str(self.icon_dir)],
-                capture_output=True,
-                timeout=5
-            )
-        except:
+            self._run_detached(['gtk-update-icon-cache', '-f', '-t', str(self.icon_dir)])
+        except OSError:
             pass  # Not critical if this fails
@@ -0,0 +1,141 @@
+"""
+File-backed HTTP response cache
+
+Keeps the body of recent GET responses on disk so repeated refreshes within a
+short window do not pay a full WAN round-trip, and so a stale copy can be
+served when the upstream API is rate-limiting or unreachable. Expired entries
+are revalidated with If-None-Match / If-Modified-Since, so an unchanged
+resource costs a 304 instead of a full download. Entries not rewritten within
+max_age are deleted, so URLs that are never requested again don't pile up.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import requests
+
+
+class ResponseCache:
+    """TTL cache for GET response bodies, keyed by URL (or a caller-chosen key)"""
+
+    # Seconds an entry is kept after it was last written (and so how long a
+    # stale copy can still be served when the upstream is unreachable)
+    DEFAULT_MAX_AGE = 60 * 60
+
+    def __init__(self, cache_dir: Optional[str] = None, max_age: float = DEFAULT_MAX_AGE):
+        if cache_dir is None:
+            cache_dir = str(Path.home() / ".scum_tracker" / "cache")
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+        self._last_prune = 0.0  # Pruned on the first write, then once per max_age
+
+    def _prune(self) -> None:
+        """Delete entries (and leftover tmp files) last written more than max_age ago"""
+        cutoff = time.time() - self.max_age
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    # Every write replaces the file, so its mtime is when it was fetched
+                    if entry.name.endswith(('.json', '.tmp')) and entry.stat().st_mtime < cutoff:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass  # Removed by another instance, or retried next prune
+        except OSError as e:
+            print(f"Error pruning response cache: {e}")
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the sidecar file path for a cache key"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_entry(self, key: str) -> Optional[dict]:
+        """Load a cached entry, or None if missing/corrupt"""
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, key: str, body: str, etag: Optional[str] = None,
+                     last_modified: Optional[str] = None) -> None:
+        """Atomically write a cache entry (tmp file + rename)"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._entry_path(key)
+            tmp_path = path.with_suffix('.tmp')
+            entry = {
+                'fetched_at': time.time(),
+                'body': body,
+                'etag': etag,
+                'last_modified': last_modified,
+            }
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing response cache: {e}")
+            return
+
+        now = time.time()
+        if now - self._last_prune >= self.max_age:
+            self._last_prune = now
+            self._prune()
+
+    def get(self, session: requests.Session, url: str, ttl: float = 30,
+            stale_ok: bool = True,
+            timeout: Union[float, Tuple[float, float]] = 15,
+            key: Optional[str] = None) -> str:
+        """
+        Get a response body, using the cached copy while it is fresh
+
+        Args:
+            session: Session used for the request on a cache miss
+            url: URL to fetch
+            ttl: Seconds a cached body is considered fresh
+            stale_ok: Return an expired body if the request fails
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            key: Cache key (defaults to the URL). URLs that differ each time
+                for the same resource, like cursor pages, should share a key
+                so the entry and its validators are found again
+
+        Returns:
+            Response body text
+
+        Raises:
+            requests.RequestException if the request fails and no usable
+            cached copy exists
+        """
+        if key is None:
+            key = url
+        entry = self._read_entry(key)
+        if entry and time.time() - entry.get('fetched_at', 0) < ttl:
+            return entry['body']
+
+        # Ask the server to confirm the cached copy instead of resending it
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 304 and entry:
+                # Unchanged upstream - keep the body, restart its TTL
+                self._write_entry(key, entry['body'], entry.get('etag'), entry.get('last_modified'))
+                return entry['body']
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if stale_ok and entry:
+                print(f"Request failed, using cached response: {e}")
+                return entry['body']
+            raise
+
+        body = response.text
+        self._write_entry(key, body, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return body
@@ -6,10 +6,16 @@ GeoIP can be inaccurate due to:
 - Multi-region datacenters (G-Portal, OVH, etc.)
 - IP blocks registered in different countries
 """
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from scum_tracker.models.server import ServerTable
 
 # Typical ping ranges from US West Coast (in milliseconds)
 # Based on geographic distance and typical routing
-PING_EXPECTATIONS = {
+PING_EXPECTATIONS = MappingProxyType({
     # North America
     "US": (10, 80),
     "CA": (20, 100),
@@ -43,7 +49,13 @@ PING_EXPECTATIONS = {
     # Oceania
     "AU": (150, 280),
     "NZ": (160, 290),
-}
+})  # Read-only: the cached lookups below assume it never changes
+
+# PING_EXPECTATIONS as arrays (same order) for scoring many pings at once.
+# Codes stay object dtype so "Unknown" can be stored alongside them.
+_CODE_ARR = np.array(list(PING_EXPECTATIONS), dtype=object)
+_MIN_ARR = np.fromiter((r[0] for r in PING_EXPECTATIONS.values()), dtype=np.int16)
+_MAX_ARR = np.fromiter((r[1] for r in PING_EXPECTATIONS.values()), dtype=np.int16)
 
 
 class LocationAnalyzer:
@@ -55,6 +67,7 @@ class LocationAnalyzer:
         return PING_EXPECTATIONS.get(country_code, (0, 1000))
     
     @staticmethod
+    @lru_cache(maxsize=4096)  # Pings are whole ms, so (country, ping) pairs repeat
     def is_location_mismatch(country_code: str, ping_ms: int, threshold_percent: float = 0.2) -> bool:
         """
         Detect if ping time doesn't match declared location
@@ -84,6 +97,7 @@ class LocationAnalyzer:
         return False
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def guess_likely_location(ping_ms: int) -> str:
         """
         Guess likely location based on ping time
@@ -109,9 +123,67 @@ class LocationAnalyzer:
             if distance < best_distance:
                 best_distance = distance
                 best_match = country
+                if distance == 0:
+                    break  # Nothing can beat an in-range match
         
         return best_match or "Unknown"
     
+    @staticmethod
+    def guess_likely_location_batch(pings) -> np.ndarray:
+        """
+        Guess likely locations for many ping times at once
+        
+        Same result as guess_likely_location for each ping, scored against
+        every country in one broadcast rather than a Python loop per ping.
+        
+        Args:
+            pings: Sequence or array of pings in milliseconds
+        
+        Returns:
+            Array of country codes ("Unknown" where the ping is missing or <= 0)
+        """
+        pings = np.asarray(pings, dtype=float).reshape(-1, 1)  # None -> nan
+        distance = np.maximum(_MIN_ARR - pings, 0) + np.maximum(pings - _MAX_ARR, 0)
+        
+        # argmin returns the first best match, like the strict < in the loop
+        codes = _CODE_ARR[np.argmin(distance, axis=1)]
+        invalid = ~(pings[:, 0] > 0)  # Also catches nan
+        codes[invalid] = "Unknown"
+        return codes
+    
+    @staticmethod
+    def analyze_all(table: ServerTable, threshold_percent: float = 0.2) -> dict:
+        """
+        Analyze location accuracy for every server in a table at once
+        
+        Vectorized equivalent of calling analyze_server per server.
+        
+        Returns dict of arrays aligned with the table rows:
+        expected_min, expected_max, is_mismatch, likely_location
+        """
+        ranges = [LocationAnalyzer.get_expected_ping_range(c) for c in table.countries]
+        expected_min = np.array([r[0] for r in ranges], dtype=np.int32)
+        expected_max = np.array([r[1] for r in ranges], dtype=np.int32)
+        
+        pings = table.pings
+        is_mismatch = (
+            (pings > 0)
+            & (table.countries != "Unknown")
+            & ((pings < expected_min * (1 - threshold_percent))
+               | (pings > expected_max * (1 + threshold_percent * 2)))
+        )
+        
+        likely_location = table.countries.copy()
+        if is_mismatch.any():
+            likely_location[is_mismatch] = LocationAnalyzer.guess_likely_location_batch(pings[is_mismatch])
+        
+        return {
+            "expected_min": expected_min,
+            "expected_max": expected_max,
+            "is_mismatch": is_mismatch,
+            "likely_location": likely_location,
+        }
+    
     @staticmethod
     def analyze_server(server_name: str, country_code: str, ping_ms: int) -> dict:
         """
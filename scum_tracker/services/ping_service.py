@@ -1,80 +1,162 @@
 """
 Ping service for measuring server latency
 """
+import errno
+import os
+import selectors
 import socket
-import platform
-from datetime import datetime
-from typing import Optional
+import time
+from typing import Callable, List, Optional, Tuple
 from scum_tracker.models.server import PingRecord
 
 
+# connect_ex() results that mean a non-blocking connect is still in progress
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', 10035)}
+
+
 class PingService:
     """Handles ping operations for servers"""
-    
-    # Windows-specific socket options for better performance
-    _is_windows = platform.system() == 'Windows'
-    
+
+    # Seconds to wait for a TCP connection before counting it as a timeout
+    TIMEOUT = 1.5
+
+    # Maximum connects in progress at once (select() on Windows caps at 512 sockets)
+    MAX_IN_FLIGHT = 256
+
+    @staticmethod
+    def _create_socket() -> socket.socket:
+        """Create a non-blocking TCP socket for a connect probe"""
+        # No extra options: nothing is ever sent, so TCP_NODELAY has no effect,
+        # and SO_REUSEADDR only matters for bind(), not outbound connects
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        return sock
+
+    @staticmethod
+    def _resolve(host: str, resolved: dict) -> str:
+        """
+        Resolve a host to an IPv4 address, memoizing into resolved
+        
+        IP literals (everything BattleMetrics returns) skip the resolver.
+        Raises OSError if the name can't be resolved.
+        """
+        address = resolved.get(host)
+        if address is None:
+            try:
+                socket.inet_aton(host)
+                address = host
+            except OSError:
+                address = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+            resolved[host] = address
+        return address
+
     @staticmethod
     def ping_server(ip: str, port: int) -> PingRecord:
         """Ping a server by attempting TCP connection to the game port"""
-        sock = None
+        return PingService.ping_many([(ip, port)])[0]
+
+    @staticmethod
+    def ping_many(targets: List[Tuple[str, int]],
+                  timeout: Optional[float] = None,
+                  on_result: Optional[Callable[[int, PingRecord], None]] = None) -> List[PingRecord]:
+        """
+        Ping many servers at once with non-blocking TCP connects
+
+        All connects are started up front (up to MAX_IN_FLIGHT at a time) and
+        their completions are multiplexed with a selector, so a sweep takes
+        about one timeout rather than one timeout per server.
+
+        Args:
+            targets: List of (ip, port) tuples
+            timeout: Seconds to wait for each connection (defaults to TIMEOUT)
+            on_result: Called with (index, record) as each ping finishes
+
+        Returns:
+            PingRecords in the same order as targets; server_id is left for
+            the caller to set
+        """
+        if timeout is None:
+            timeout = PingService.TIMEOUT
+        timeout_ns = int(timeout * 1_000_000_000)
+
+        results: List[Optional[PingRecord]] = [None] * len(targets)
+
+        def finish(index: int, record: PingRecord):
+            results[index] = record
+            if on_result is not None:
+                on_result(index, record)
+
+        selector = selectors.DefaultSelector()
+        in_flight = {}  # socket -> (index, start, deadline) in perf_counter_ns() units
+        next_index = 0
+        resolved = {}  # Each hostname is looked up once per sweep
+
         try:
-            start_time = datetime.now()
-            
-            # Create socket with optimizations
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            
-            # Windows-specific optimizations
-            if PingService._is_windows:
-                try:
-                    # Disable Nagle's algorithm for faster small packet sends
-                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                    # Enable quick socket reuse (helps with rapid successive pings)
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                except (OSError, AttributeError):
-                    pass  # Some options may not be available
-            
-            # Set connection timeout (shorter for better responsiveness)
-            sock.settimeout(1.5)
-            
-            try:
-                # Attempt to connect to the server's game port
-                sock.connect((ip, port))
-                latency = int((datetime.now() - start_time).total_seconds() * 1000)
-                
-                return PingRecord(
-                    server_id="",  # Will be set by caller
-                    latency=latency,
-                    success=True
-                )
-            except socket.timeout:
-                latency = int((datetime.now() - start_time).total_seconds() * 1000)
-                return PingRecord(
-                    server_id="",
-                    latency=-1,
-                    success=False,
-                    error_message="Connection timeout"
-                )
-            except socket.error as e:
-                latency = int((datetime.now() - start_time).total_seconds() * 1000)
-                return PingRecord(
-                    server_id="",
-                    latency=-1,
-                    success=False,
-                    error_message=f"Connection failed: {str(e)}"
-                )
-        
-        except Exception as e:
-            return PingRecord(
-                server_id="",
-                latency=-1,
-                success=False,
-                error_message=str(e)
-            )
-        finally:
-            # Ensure socket is properly closed
-            if sock is not None:
-                try:
+            while next_index < len(targets) or in_flight:
+                # Start connects until the in-flight window is full
+                while next_index < len(targets) and len(in_flight) < PingService.MAX_IN_FLIGHT:
+                    index = next_index
+                    next_index += 1
+                    sock = None
+                    try:
+                        host, port = targets[index]
+                        address = (PingService._resolve(host, resolved), port)
+                        sock = PingService._create_socket()
+                        start = time.perf_counter_ns()
+                        code = sock.connect_ex(address)
+                    except Exception as e:
+                        if sock is not None:
+                            sock.close()
+                        finish(index, PingRecord(server_id="", latency=-1, success=False,
+                                                 error_message=str(e)))
+                        continue
+
+                    if code == 0:
+                        # Connected immediately (e.g. a local server)
+                        latency = (time.perf_counter_ns() - start) // 1_000_000
+                        sock.close()
+                        finish(index, PingRecord(server_id="", latency=latency, success=True))
+                    elif code in _CONNECT_IN_PROGRESS:
+                        selector.register(sock, selectors.EVENT_WRITE)
+                        in_flight[sock] = (index, start, start + timeout_ns)
+                    else:
+                        sock.close()
+                        finish(index, PingRecord(server_id="", latency=-1, success=False,
+                                                 error_message=f"Connection failed: {os.strerror(code)}"))
+
+                if not in_flight:
+                    continue
+
+                # Wait until a connect completes or the earliest one times out
+                now = time.perf_counter_ns()
+                earliest = min(deadline for _, _, deadline in in_flight.values())
+                for key, _ in selector.select(max(0, earliest - now) / 1_000_000_000):
+                    sock = key.fileobj
+                    index, start, _ = in_flight.pop(sock)
+                    latency = (time.perf_counter_ns() - start) // 1_000_000
+                    error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    selector.unregister(sock)
                     sock.close()
-                except:
-                    pass
+
+                    if error == 0:
+                        finish(index, PingRecord(server_id="", latency=latency, success=True))
+                    else:
+                        finish(index, PingRecord(server_id="", latency=-1, success=False,
+                                                 error_message=f"Connection failed: {os.strerror(error)}"))
+
+                # Anything past its deadline has timed out
+                now = time.perf_counter_ns()
+                for sock, (index, _, deadline) in list(in_flight.items()):
+                    if now >= deadline:
+                        del in_flight[sock]
+                        selector.unregister(sock)
+                        sock.close()
+                        finish(index, PingRecord(server_id="", latency=-1, success=False,
+                                                 error_message="Connection timeout"))
+        finally:
+            # Ensure sockets are properly closed (close() doesn't raise, even twice)
+            for sock in in_flight:
+                sock.close()
+            selector.close()
+
+        return results
@@ -29,13 +29,27 @@ Notes:
 - You can add missing servers manually via the MANUAL_SERVERS list
 """
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import List
-from scum_tracker.models.server import GameServer
+from typing import Dict, List, Optional, Tuple
+from scum_tracker.models.server import GameServer, ServerTable
+from scum_tracker.services.http_cache import ResponseCache
+from scum_tracker.services.steam_query import A2SQuerier
 import uuid
 import a2s
 
+try:
+    # orjson parses large API responses 2-3x faster; optional
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# BattleMetrics server attributes GameServer is built from, in one lookup
+_SERVER_ATTRS = itemgetter("name", "ip", "port", "players", "maxPlayers", "country")
+
 
 class ServerManager:
     """Handles fetching and managing game servers"""
@@ -43,8 +57,18 @@ class ServerManager:
     BATTLEMETRICS_API = "https://api.battlemetrics.com/servers"
     GAME_ID = "scum"
     
+    # Sparse fieldset - only the server attributes GameServer is built from
+    SERVER_FIELDS = "name,ip,port,players,maxPlayers,country,details"
+    
+    # Seconds a cached BattleMetrics page is reused before refetching
+    CACHE_TTL = 30
+    
+    # (connect, read) timeouts in seconds for BattleMetrics requests
+    REQUEST_TIMEOUT = (3.05, 15)
+    
     # Shared session with connection pooling for better performance on Windows
     _session = None
+    _cache = None
     
     @classmethod
     def _get_session(cls):
@@ -78,6 +102,13 @@ class ServerManager:
         
         return cls._session
     
+    @classmethod
+    def _get_cache(cls) -> ResponseCache:
+        """Get or create the shared BattleMetrics response cache"""
+        if cls._cache is None:
+            cls._cache = ResponseCache()
+        return cls._cache
+    
     # Version mapping from BattleMetrics internal version to in-game display version
     # Based on official SCUM servers:
     # - Stable: "Official" = 1.1.0.5.101995
@@ -97,6 +128,7 @@ class ServerManager:
     ]
 
     @staticmethod
+    @lru_cache(maxsize=256)  # Only a handful of distinct versions are live at once
     def convert_battlemetrics_version(bm_version: str) -> str:
         """
         Convert BattleMetrics internal version to in-game display version.
@@ -112,12 +144,16 @@ class ServerManager:
         if not bm_version or bm_version == "Unknown":
             return "Unknown"
         
-        # Try to match the first 3 segments (0.X.Y)
-        parts = bm_version.split('.')
-        if len(parts) >= 3:
-            version_key = f"{parts[0]}.{parts[1]}.{parts[2]}"
-            if version_key in ServerManager.VERSION_MAPPING:
-                return ServerManager.VERSION_MAPPING[version_key]
+        # Try to match the first 3 segments (0.X.Y) - slice up to the third
+        # dot rather than splitting and re-joining
+        first_dot = bm_version.find('.')
+        second_dot = bm_version.find('.', first_dot + 1) if first_dot >= 0 else -1
+        if second_dot >= 0:
+            third_dot = bm_version.find('.', second_dot + 1)
+            version_key = bm_version if third_dot < 0 else bm_version[:third_dot]
+            mapped = ServerManager.VERSION_MAPPING.get(version_key)
+            if mapped is not None:
+                return mapped
         
         # Fall back to the full BattleMetrics version if no mapping found
         return bm_version
@@ -125,9 +161,45 @@ class ServerManager:
     @staticmethod
     def fetch_servers() -> List[GameServer]:
         """Fetch servers from BattleMetrics API and add manual servers"""
-        servers = ServerManager._fetch_battlemetrics_servers()
-        servers.extend(ServerManager._get_manual_servers())
-        return servers
+        return ServerManager._merge_sources([
+            ServerManager._fetch_battlemetrics_servers(),
+            ServerManager._get_manual_servers(),
+        ])
+
+    @staticmethod
+    def _filled_fields(server: GameServer) -> int:
+        """Count the descriptive fields of a server that aren't placeholders"""
+        return sum(1 for value in (server.name, server.map, server.region, server.version)
+                   if value not in ("Unknown", "??", "")) + (server.max_players > 0)
+
+    @staticmethod
+    def _merge_sources(sources: List[List[GameServer]]) -> List[GameServer]:
+        """
+        Merge server lists from several sources, keeping one entry per address
+        
+        Args:
+            sources: Server lists in priority order
+            
+        Returns:
+            Merged list in first-seen order. When two sources list the same
+            (ip, port), the entry with more filled-in fields wins, and the
+            earlier source wins a tie.
+        """
+        merged: Dict[Tuple[str, int], GameServer] = {}
+        for servers in sources:
+            for server in servers:
+                # Placeholder addresses don't identify a server, so never merge them
+                key = (server.ip, server.port) if server.port else (server.id, None)
+                existing = merged.setdefault(key, server)
+                if existing is not server and (ServerManager._filled_fields(server)
+                                               > ServerManager._filled_fields(existing)):
+                    merged[key] = server
+        return list(merged.values())
+
+    @staticmethod
+    def fetch_servers_soa() -> ServerTable:
+        """Fetch servers like fetch_servers, as a ServerTable for bulk analysis"""
+        return ServerTable.from_servers(ServerManager.fetch_servers())
 
     @staticmethod
     def _fetch_battlemetrics_servers() -> List[GameServer]:
@@ -135,49 +207,92 @@ class ServerManager:
         try:
             servers = []
             session = ServerManager._get_session()
-            url = f"{ServerManager.BATTLEMETRICS_API}?filter[game]={ServerManager.GAME_ID}&page[size]=100"
-            page_count = 0
+            cache = ServerManager._get_cache()
+            url = (
+                f"{ServerManager.BATTLEMETRICS_API}?filter[game]={ServerManager.GAME_ID}"
+                f"&page[size]=100&fields[server]={ServerManager.SERVER_FIELDS}"
+                f"&sort=-players"  # Busiest servers first, so the page cap drops the emptiest
+            )
             max_pages = 10  # Limit to ~1000 servers to keep load times reasonable
             
-            while url and page_count < max_pages:
-                response = session.get(
-                    url,
-                    timeout=15  # Increased timeout for better reliability on Windows
+            def fetch_page(page_url: str, page_number: int) -> dict:
+                # Later pages' cursors change whenever player counts do, so
+                # pages are cached by position; keyed by URL, their entries
+                # (and ETags to revalidate with) would never be found again
+                body = cache.get(
+                    session,
+                    page_url,
+                    ttl=ServerManager.CACHE_TTL,
+                    timeout=ServerManager.REQUEST_TIMEOUT,
+                    key=f"{url}#page={page_number}"
                 )
-                response.raise_for_status()
-                
-                data = response.json()
-                server_list = data.get("data", [])
+                return json_loads(body)
+            
+            # Each page's cursor is only known once the previous page arrives,
+            # so the pages themselves can't be requested in parallel. Instead the
+            # next request is started before building servers from this one.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                data = fetch_page(url, 1)
+                page_count = 1
                 
-                # Process servers from this page
-                for server_data in server_list:
-                    attrs = server_data.get("attributes", {})
-                    details = attrs.get("details", {})
+                while data is not None:
+                    # Get next page URL from links
+                    next_url = data.get("links", {}).get("next")
+                    next_page = None
+                    if next_url and page_count < max_pages:
+                        next_page = executor.submit(fetch_page, next_url, page_count + 1)
                     
-                    server = GameServer(
-                        id=server_data.get("id", str(uuid.uuid4())),
-                        name=attrs.get("name", "Unknown"),
-                        ip=attrs.get("ip", "0.0.0.0"),
-                        port=attrs.get("port", 0),
-                        players=attrs.get("players", 0),
-                        max_players=attrs.get("maxPlayers", 0),
-                        map=details.get("map", "Unknown"),
-                        region=attrs.get("country", "Unknown"),
-                        version=details.get("version", "Unknown"),
-                    )
-                    servers.append(server)
-                
-                # Get next page URL from links
-                links = data.get("links", {})
-                url = links.get("next")
-                page_count += 1
+                    servers.extend(ServerManager._parse_battlemetrics_page(data))
+                    
+                    data = next_page.result() if next_page else None
+                    page_count += 1
             
             return servers
         
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"Error fetching servers from BattleMetrics: {e}")
             return []
     
+    @staticmethod
+    def _parse_battlemetrics_page(data: dict) -> List[GameServer]:
+        """Build GameServers from one page of a BattleMetrics server list response"""
+        servers = []
+        append = servers.append
+        for server_data in data.get("data", []):
+            attrs = server_data.get("attributes", {})
+            
+            # Records normally carry every attribute, so fetch them all at once
+            # and only fall back to per-field defaults when one is missing
+            try:
+                name, ip, port, players, max_players, country = _SERVER_ATTRS(attrs)
+            except KeyError:
+                get = attrs.get
+                name = get("name", "Unknown")
+                ip = get("ip", "0.0.0.0")
+                port = get("port", 0)
+                players = get("players", 0)
+                max_players = get("maxPlayers", 0)
+                country = get("country", "Unknown")
+            details_get = attrs.get("details", {}).get
+            
+            # Only generate a fallback ID when the record doesn't have one
+            server_id = server_data.get("id")
+            if server_id is None:
+                server_id = str(uuid.uuid4())
+            
+            append(GameServer(
+                id=server_id,
+                name=name,
+                ip=ip,
+                port=port,
+                players=players,
+                max_players=max_players,
+                map=details_get("map", "Unknown"),
+                region=country,
+                version=details_get("version", "Unknown"),
+            ))
+        return servers
+    
     @staticmethod
     def _get_manual_servers() -> List[GameServer]:
         """Get manually added servers"""
@@ -223,3 +338,50 @@ class ServerManager:
         except Exception as e:
             print(f"A2S query failed for {ip}:{port}: {e}")
             return None
+    
+    @staticmethod
+    def query_servers_realtime(addresses: List[Tuple[str, int]],
+                               max_workers: int = 64) -> Dict[Tuple[str, int], Optional[dict]]:
+        """
+        Query many servers with A2S at once.
+        
+        All requests go out over one shared UDP socket and replies are matched
+        by source address, so a sweep takes about one timeout in total. Servers
+        whose reply the batch parser can't read are retried with a2s.info on a
+        thread pool; servers that didn't answer at all are not retried.
+        
+        Args:
+            addresses: List of (ip, port) tuples
+            max_workers: Maximum number of concurrent a2s.info fallback queries
+            
+        Returns:
+            dict mapping each (ip, port) to its query_server_realtime result
+        """
+        # Query each distinct server once
+        addresses = list(dict.fromkeys(addresses))
+        if not addresses:
+            return {}
+        
+        unparsed = set()
+        with A2SQuerier() as querier:
+            infos = querier.query_servers(addresses, unparsed=unparsed)
+        
+        results = {}
+        for address, info in infos.items():
+            if info is not None:
+                results[address] = {
+                    'name': info.name,
+                    'players': info.players,
+                    'max_players': info.max_players,
+                    'map': info.map,
+                    'version': info.version,
+                    'game': info.game,
+                }
+        
+        failed = [address for address in addresses if address in unparsed]
+        if failed:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(failed))) as executor:
+                fallback = executor.map(lambda address: ServerManager.query_server_realtime(*address), failed)
+                results.update(zip(failed, fallback))
+        
+        return {address: results.get(address) for address in addresses}
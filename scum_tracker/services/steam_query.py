@@ -7,12 +7,25 @@ This module provides direct communication with Steam's infrastructure to:
 
 This bypasses BattleMetrics and gets data directly from the source.
 """
+import selectors
 import socket
 import struct
-from typing import List, Tuple, Optional
+import time
+from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 
 
+# Fixed-size A2S_INFO fields after the game string: app ID, players,
+# max players, bots, server type, environment, visibility, VAC
+_A2S_INFO_FIELDS = struct.Struct('<HBBBccBB')
+
+# Master server list entry: 4-byte IPv4 address + big-endian port
+_MASTER_ENTRY = struct.Struct('>4sH')
+
+# Entry that marks the end of the master server list (0.0.0.0:0)
+_MASTER_END = (b'\x00\x00\x00\x00', 0)
+
+
 @dataclass
 class ServerInfo:
     """Information about a game server from A2S query"""
@@ -35,15 +48,21 @@ class SteamMasterServerQuerier:
     """Query Steam's master server list for game servers"""
     
     # Steam master server addresses (using IPs to avoid DNS issues)
-    MASTER_SERVERS = [
-        '208.64.200.52:27011',  # Valve master server
-        '208.64.200.65:27011',  # Valve master server  
-        '208.78.164.10:27011',  # Alternative
-    ]
+    MASTER_SERVERS = (
+        ('208.64.200.52', 27011),  # Valve master server
+        ('208.64.200.65', 27011),  # Valve master server
+        ('208.78.164.10', 27011),  # Alternative
+    )
     
     # SCUM App ID
     SCUM_APP_ID = 513650
     
+    # Query type ('1') + region (0xFF = all), identical for every request
+    QUERY_PREFIX = b'1\xFF'
+    
+    # Seed for the first request of a listing
+    NULL_SEED = b'0.0.0.0:0\x00'
+    
     @staticmethod
     def get_server_list(timeout: float = 5.0) -> List[Tuple[str, int]]:
         """
@@ -52,13 +71,8 @@ class SteamMasterServerQuerier:
         Returns:
             List of (ip, port) tuples
         """
-        for master_addr_str in SteamMasterServerQuerier.MASTER_SERVERS:
+        for master_addr in SteamMasterServerQuerier.MASTER_SERVERS:
             try:
-                # Parse master server address
-                host, port = master_addr_str.rsplit(':', 1)
-                port = int(port)
-                master_addr = (host, port)
-                
                 servers = SteamMasterServerQuerier._query_master(
                     master_addr, 
                     SteamMasterServerQuerier.SCUM_APP_ID,
@@ -69,7 +83,7 @@ class SteamMasterServerQuerier:
                     return servers
                     
             except Exception as e:
-                print(f"Error querying {master_addr_str}: {e}")
+                print(f"Error querying {master_addr[0]}:{master_addr[1]}: {e}")
                 continue
         
         return []
@@ -89,9 +103,11 @@ class SteamMasterServerQuerier:
         sock.settimeout(timeout)
         
         servers = []
-        seed = b'0.0.0.0:0\x00'  # Start with null seed
-        region = b'\xFF'  # All regions
+        seen = set()
+        seed = SteamMasterServerQuerier.NULL_SEED
+        # Only the seed changes between requests, so build the rest once
         filter_str = f'\\appid\\{appid}'.encode() + b'\x00'
+        prefix = SteamMasterServerQuerier.QUERY_PREFIX
         
         try:
             max_iterations = 100  # Prevent infinite loops
@@ -99,7 +115,7 @@ class SteamMasterServerQuerier:
             
             while iteration < max_iterations:
                 # Build query packet
-                query = b'1' + region + seed + filter_str
+                query = prefix + seed + filter_str
                 
                 sock.sendto(query, master_addr)
                 
@@ -113,30 +129,28 @@ class SteamMasterServerQuerier:
                 if len(data) < 6:
                     break
                 
-                # Parse IP:port pairs starting at byte 6
-                i = 6
+                # Parse 6-byte IP:port entries starting at byte 6 (ignoring
+                # any trailing partial entry)
+                end = 6 + (len(data) - 6) // _MASTER_ENTRY.size * _MASTER_ENTRY.size
                 batch_servers = []
                 
-                while i + 6 <= len(data):
-                    # Read 4 bytes for IP, 2 bytes for port (big-endian)
-                    ip_bytes = data[i:i+4]
-                    port_bytes = data[i+4:i+6]
-                    
-                    ip = '.'.join(str(b) for b in ip_bytes)
-                    port = struct.unpack('>H', port_bytes)[0]
-                    
+                for entry in _MASTER_ENTRY.iter_unpack(memoryview(data)[6:end]):
                     # Check for end marker
-                    if ip == '0.0.0.0' and port == 0:
+                    if entry == _MASTER_END:
                         return servers
                     
-                    batch_servers.append((ip, port))
-                    i += 6
+                    ip_bytes, port = entry
+                    batch_servers.append((socket.inet_ntoa(ip_bytes), port))
                 
                 if not batch_servers:
                     # No servers in this batch
                     break
                 
-                servers.extend(batch_servers)
+                # Servers can repeat across pages; keep the first occurrence
+                for server in batch_servers:
+                    if server not in seen:
+                        seen.add(server)
+                        servers.append(server)
                 
                 # Use last server as seed for next query
                 last_ip, last_port = batch_servers[-1]
@@ -153,43 +167,226 @@ class SteamMasterServerQuerier:
 
 
 class A2SQuerier:
-    """Query individual game servers using Source A2S protocol"""
+    """
+    Query individual game servers using Source A2S protocol
+    
+    One UDP socket is opened per querier and shared by every query, so use a
+    single instance (ideally as a context manager) for a whole sweep.
+    """
     
     # A2S_INFO request packet
     A2S_INFO_REQUEST = b'\xFF\xFF\xFF\xFF\x54Source Engine Query\x00'
     
-    @staticmethod
-    def query_server(address: Tuple[str, int], timeout: float = 3.0) -> Optional[ServerInfo]:
+    # Servers that want a challenge reply with 0x41 + a 4-byte token, which
+    # has to be appended to a resent request
+    A2S_CHALLENGE = 0x41
+    
+    # Challenge replies accepted per server before giving up on it
+    MAX_CHALLENGES = 2
+    
+    # Socket buffer size for batch queries - bursts of replies from hundreds
+    # of servers can overflow the default receive buffer and get dropped
+    SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+    
+    # Global cap on outgoing requests per second for batch queries
+    MAX_SEND_RATE = 500
+    
+    # Wait per attempt: most servers answer well within the first window,
+    # and a single resend at a longer timeout catches slow or lossy links
+    DEFAULT_TIMEOUTS = (0.5, 1.5)
+    
+    # Once this many servers have answered a batch, retries only wait
+    # RTT_MULTIPLIER times the slowest reply seen (but never less than the
+    # first timeout), since live servers have shown how long they take
+    MIN_RTT_SAMPLES = 8
+    RTT_MULTIPLIER = 4
+    
+    def __init__(self, timeouts: Tuple[float, ...] = DEFAULT_TIMEOUTS):
+        self.timeouts = tuple(timeouts)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+            try:
+                self.sock.setsockopt(socket.SOL_SOCKET, option, self.SOCKET_BUFFER_SIZE)
+            except OSError:
+                pass  # The OS may cap or refuse the size; defaults still work
+        self.sock.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.sock, selectors.EVENT_READ)
+    
+    def close(self) -> None:
+        """Close the shared socket"""
+        self.selector.close()
+        self.sock.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def query_server(self, address: Tuple[str, int],
+                     timeouts: Optional[Tuple[float, ...]] = None) -> Optional[ServerInfo]:
         """
         Query a server for information using A2S_INFO protocol
         
         Args:
             address: (ip, port) tuple
-            timeout: Query timeout in seconds
+            timeouts: Seconds to wait for each attempt (defaults to the querier's schedule)
             
         Returns:
             ServerInfo object or None if query fails
         """
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(timeout)
+        return self.query_servers([address], timeouts).get(address)
+    
+    def query_servers(self, addresses: List[Tuple[str, int]],
+                      timeouts: Optional[Tuple[float, ...]] = None,
+                      max_in_flight: int = 64,
+                      max_rate: Optional[float] = None,
+                      unparsed: Optional[Set[Tuple[str, int]]] = None) -> Dict[Tuple[str, int], Optional[ServerInfo]]:
+        """
+        Query many servers concurrently over the shared UDP socket
+
+        Requests are sent without waiting for earlier replies and responses are
+        matched back to their target by source address, so the total wait is
+        roughly one timeout per max_in_flight servers instead of one per server.
+        Sends are paced by a token bucket so bursts stay under max_rate.
+        A server that has not answered when an attempt times out is sent the
+        request again, once per remaining entry in timeouts. Retry waits are
+        shortened to fit the round trip times of the servers that did answer.
+        Challenge replies are answered straight away by resending the request
+        with the challenge appended.
         
-        try:
-            # Send A2S_INFO request
-            sock.sendto(A2SQuerier.A2S_INFO_REQUEST, address)
-            
-            # Receive response
-            data, _ = sock.recvfrom(4096)
-            
-            # Parse response
-            return A2SQuerier._parse_a2s_info(data)
+        Args:
+            addresses: List of (ip, port) tuples
+            timeouts: Seconds to wait for each attempt (defaults to the querier's schedule)
+            max_in_flight: Maximum number of unanswered requests at once
+            max_rate: Maximum requests sent per second (defaults to MAX_SEND_RATE)
+            unparsed: If given, filled with the addresses that replied with
+                something this parser can't read (as opposed to not replying)
             
-        except socket.timeout:
-            return None
+        Returns:
+            Dict mapping each address to a ServerInfo, or None if the query failed
+        
+        Raises:
+            ValueError: If max_rate is not positive
+        """
+        if timeouts is None:
+            timeouts = self.timeouts
+        if max_rate is None:
+            max_rate = self.MAX_SEND_RATE
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        
+        # Duplicate addresses are queried once
+        results = {address: None for address in addresses}
+        
+        # Replies arrive from the resolved IP, so requests are keyed by it.
+        # Different names for the same server share one request.
+        requested_by = {}  # resolved address -> requested addresses
+        for address in results:
+            try:
+                resolved = (socket.gethostbyname(address[0]), address[1])
+            except OSError:
+                continue
+            requested_by.setdefault(resolved, []).append(address)
+        targets = list(requested_by)
+        
+        pending = {}  # resolved address -> (attempt index, send time, deadline)
+        next_target = 0
+        replies = 0
+        slowest_rtt = 0.0
+        challenges = {}  # resolved address -> (challenge token, times challenged)
+        tokens = float(max_in_flight)
+        last_refill = time.monotonic()
+        
+        try:
+            while next_target < len(targets) or pending:
+                now = time.monotonic()
+                
+                # Top up outstanding requests, as far as the send budget allows
+                tokens = min(float(max_in_flight), tokens + (now - last_refill) * max_rate)
+                last_refill = now
+                while next_target < len(targets) and len(pending) < max_in_flight and tokens >= 1:
+                    resolved = targets[next_target]
+                    next_target += 1
+                    tokens -= 1
+                    try:
+                        self.sock.sendto(self.A2S_INFO_REQUEST, resolved)
+                    except OSError:
+                        continue
+                    pending[resolved] = (0, now, now + timeouts[0])
+                
+                # Retry servers whose attempt timed out, or give up after the last one
+                for resolved in [r for r, (_, _, deadline) in pending.items() if deadline <= now]:
+                    attempt = pending[resolved][0] + 1
+                    if attempt >= len(timeouts):
+                        del pending[resolved]
+                        continue
+                    request = self.A2S_INFO_REQUEST + challenges.get(resolved, (b'',))[0]
+                    try:
+                        self.sock.sendto(request, resolved)
+                    except OSError:
+                        del pending[resolved]
+                        continue
+                    timeout = timeouts[attempt]
+                    if replies >= self.MIN_RTT_SAMPLES:
+                        timeout = min(timeout, max(timeouts[0], slowest_rtt * self.RTT_MULTIPLIER))
+                    pending[resolved] = (attempt, now, now + timeout)
+                
+                # Wake for the next deadline, or when the next send token is due
+                waits = [deadline - now for _, _, deadline in pending.values()]
+                if next_target < len(targets) and len(pending) < max_in_flight:
+                    waits.append((1 - tokens) / max_rate)
+                if not waits:
+                    continue
+                if not self.selector.select(max(min(waits), 0)):
+                    continue
+                
+                # Drain every datagram already queued before waiting again.
+                # Late replies to earlier queries on this socket are ignored
+                # because their source is no longer pending.
+                received = time.monotonic()
+                while pending:
+                    try:
+                        data, source = self.sock.recvfrom(4096)
+                    except BlockingIOError:
+                        break
+                    except ConnectionResetError:
+                        # Windows reports ICMP port unreachable on the next recv
+                        continue
+                    
+                    request = pending.pop(source, None)
+                    if request is not None:
+                        replies += 1
+                        slowest_rtt = max(slowest_rtt, received - request[1])
+                        
+                        if len(data) >= 9 and data[4] == self.A2S_CHALLENGE:
+                            # Resend with the challenge now rather than letting
+                            # the attempt time out
+                            count = challenges.get(source, (b'', 0))[1] + 1
+                            if count > self.MAX_CHALLENGES:
+                                if unparsed is not None:
+                                    unparsed.update(requested_by[source])
+                                continue
+                            challenges[source] = (data[5:9], count)
+                            try:
+                                self.sock.sendto(self.A2S_INFO_REQUEST + data[5:9], source)
+                            except OSError:
+                                continue
+                            attempt = request[0]
+                            pending[source] = (attempt, received, received + timeouts[attempt])
+                            continue
+                        
+                        info = A2SQuerier._parse_a2s_info(data)
+                        for address in requested_by[source]:
+                            results[address] = info
+                        if info is None and unparsed is not None:
+                            unparsed.update(requested_by[source])
+                    
         except Exception as e:
-            print(f"A2S query error for {address}: {e}")
-            return None
-        finally:
-            sock.close()
+            print(f"A2S batch query error: {e}")
+        
+        return results
     
     @staticmethod
     def _parse_a2s_info(data: bytes) -> Optional[ServerInfo]:
@@ -222,42 +419,30 @@ class A2SQuerier:
             if data[4] != 0x49:  # 'I'
                 return None
             
-            # Start parsing at byte 5
-            idx = 5
-            
-            # Skip protocol byte
-            idx += 1
-            
-            # Read null-terminated strings
-            def read_string(start_idx):
-                end_idx = data.find(b'\x00', start_idx)
-                if end_idx == -1:
-                    return "", start_idx
-                return data[start_idx:end_idx].decode('utf-8', errors='replace'), end_idx + 1
-            
-            name, idx = read_string(idx)
-            map_name, idx = read_string(idx)
-            folder, idx = read_string(idx)
-            game, idx = read_string(idx)
+            # Split the four leading strings off in one pass (skipping the
+            # protocol byte at 5); everything after them is binary fields
+            parts = data[6:].split(b'\x00', 4)
+            if len(parts) < 5:
+                return None
             
-            # Skip app ID (2 bytes)
-            idx += 2
+            name = parts[0].decode('utf-8', errors='replace')
+            map_name = parts[1].decode('utf-8', errors='replace')
+            game = parts[3].decode('utf-8', errors='replace')
+            rest = parts[4]
             
             # Read numeric values
-            if idx + 7 > len(data):
+            if len(rest) < _A2S_INFO_FIELDS.size:
                 return None
             
-            players = data[idx]
-            max_players = data[idx + 1]
-            bots = data[idx + 2]
-            server_type = chr(data[idx + 3])
-            environment = chr(data[idx + 4])
-            visibility = data[idx + 5]
-            vac = data[idx + 6]
-            idx += 7
+            (_, players, max_players, bots, server_type, environment,
+             visibility, vac) = _A2S_INFO_FIELDS.unpack_from(rest)
             
-            # Read version string
-            version, idx = read_string(idx)
+            # Read version string (decoded straight from the packet, without
+            # slicing off and splitting the tail first)
+            version_end = rest.find(b'\x00', _A2S_INFO_FIELDS.size)
+            if version_end < 0:
+                version_end = len(rest)
+            version = str(memoryview(rest)[_A2S_INFO_FIELDS.size:version_end], 'utf-8', errors='replace')
             
             return ServerInfo(
                 name=name,
@@ -266,8 +451,8 @@ class A2SQuerier:
                 players=players,
                 max_players=max_players,
                 bots=bots,
-                server_type=server_type,
-                environment=environment,
+                server_type=server_type.decode('latin-1'),
+                environment=environment.decode('latin-1'),
                 visibility=visibility,
                 vac=vac,
                 version=version
@@ -291,10 +476,13 @@ def test_steam_queries():
         print("\nTesting A2S queries on first 5 servers:")
         print("=" * 80)
         
+        with A2SQuerier() as querier:
+            results = querier.query_servers(servers[:5])
+        
         for i, (ip, port) in enumerate(servers[:5]):
             print(f"\n{i+1}. {ip}:{port}")
             
-            info = A2SQuerier.query_server((ip, port), timeout=2.0)
+            info = results.get((ip, port))
             
             if info:
                 print(f"   Name: {info.name[:60]}")
@@ -1,6 +1,8 @@
 """Theme management service for light/dark/system theming."""
 from enum import Enum
-from PyQt6.QtGui import QColor
+from pathlib import Path
+import darkdetect
+from PyQt6.QtGui import QColor, QGuiApplication
 from PyQt6.QtCore import QSettings
 
 
@@ -14,208 +16,37 @@ class Theme(Enum):
 class ThemeService:
     """Manages application theming."""
     
-    LIGHT_STYLESHEET = """
-    QMainWindow {
-        background-color: #ffffff;
-        color: #000000;
-    }
-    QWidget {
-        background-color: #ffffff;
-        color: #000000;
-    }
-    QTableWidget {
-        background-color: #ffffff;
-        color: #000000;
-        gridline-color: #cccccc;
-    }
-    QTableWidget::item {
-        background-color: #ffffff;
-        color: #000000;
-        padding: 2px;
-    }
-    QTableWidget::item:selected {
-        background-color: #0078d4;
-        color: #ffffff;
-    }
-    QHeaderView::section {
-        background-color: #f0f0f0;
-        color: #000000;
-        padding: 5px;
-        border: 1px solid #cccccc;
-    }
-    QPushButton {
-        background-color: #e1e1e1;
-        color: #000000;
-        border: 1px solid #cccccc;
-        border-radius: 3px;
-        padding: 3px 8px;
-    }
-    QPushButton:hover {
-        background-color: #d0d0d0;
-    }
-    QPushButton:pressed {
-        background-color: #b0b0b0;
-    }
-    QLineEdit {
-        background-color: #ffffff;
-        color: #000000;
-        border: 1px solid #cccccc;
-        border-radius: 3px;
-        padding: 5px;
-    }
-    QSpinBox {
-        background-color: #ffffff;
-        color: #000000;
-        border: 1px solid #cccccc;
-        border-radius: 3px;
-        padding: 5px;
-    }
-    QCheckBox {
-        color: #000000;
-    }
-    QCheckBox::indicator {
-        width: 18px;
-        height: 18px;
-    }
-    QCheckBox::indicator:unchecked {
-        background-color: #ffffff;
-        border: 1px solid #cccccc;
-        border-radius: 3px;
-    }
-    QCheckBox::indicator:checked {
-        background-color: #ffffff;
-        border: 1px solid #cccccc;
-        border-radius: 3px;
-        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTgiIGhlaWdodD0iMTgiIHZpZXdCb3g9IjAgMCAxOCAxOCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cGF0aCBkPSJNMTUgNUw3IDEzTDMgOSIgc3Ryb2tlPSIjMDBBQTAwIiBzdHJva2Utd2lkdGg9IjIuNSIgZmlsbD0ibm9uZSIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+PC9zdmc+);
-        background-repeat: no-repeat;
-        background-position: center;
-    }
-    QGroupBox {
-        color: #000000;
-        border: 1px solid #cccccc;
-        border-radius: 5px;
-        margin-top: 10px;
-        padding-top: 10px;
-    }
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 10px;
-        padding: 0 3px 0 3px;
-    }
-    QScrollArea {
-        background-color: #ffffff;
-    }
-    QLabel {
-        color: #000000;
-    }
-    QDialog {
-        background-color: #ffffff;
-    }
-    """
+    # Stylesheets live in assets/<name>.qss and are only read when first used
+    ASSETS_DIR = Path(__file__).parent.parent / "assets"
+    _stylesheets = {}
     
-    DARK_STYLESHEET = """
-    QMainWindow {
-        background-color: #2d2d2d;
-        color: #ffffff;
-    }
-    QWidget {
-        background-color: #2d2d2d;
-        color: #ffffff;
-    }
-    QTableWidget {
-        background-color: #1e1e1e;
-        color: #ffffff;
-        gridline-color: #444444;
-    }
-    QTableWidget::item {
-        background-color: #1e1e1e;
-        color: #ffffff;
-        padding: 2px;
-    }
-    QTableWidget::item:selected {
-        background-color: #0078d4;
-        color: #ffffff;
-    }
-    QHeaderView::section {
-        background-color: #3d3d3d;
-        color: #ffffff;
-        padding: 5px;
-        border: 1px solid #444444;
-    }
-    QPushButton {
-        background-color: #3d3d3d;
-        color: #ffffff;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        padding: 3px 8px;
-    }
-    QPushButton:hover {
-        background-color: #4d4d4d;
-    }
-    QPushButton:pressed {
-        background-color: #5d5d5d;
-    }
-    QLineEdit {
-        background-color: #3d3d3d;
-        color: #ffffff;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        padding: 5px;
-    }
-    QSpinBox {
-        background-color: #3d3d3d;
-        color: #ffffff;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        padding: 5px;
-    }
-    QCheckBox {
-        color: #ffffff;
-    }
-    QCheckBox::indicator {
-        width: 18px;
-        height: 18px;
-    }
-    QCheckBox::indicator:unchecked {
-        background-color: #3d3d3d;
-        border: 1px solid #555555;
-        border-radius: 3px;
-    }
-    QCheckBox::indicator:checked {
-        background-color: #3d3d3d;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTgiIGhlaWdodD0iMTgiIHZpZXdCb3g9IjAgMCAxOCAxOCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cGF0aCBkPSJNMTUgNUw3IDEzTDMgOSIgc3Ryb2tlPSIjNENDQTUwIiBzdHJva2Utd2lkdGg9IjIuNSIgZmlsbD0ibm9uZSIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+PC9zdmc+);
-        background-repeat: no-repeat;
-        background-position: center;
-    }
-    QGroupBox {
-        color: #ffffff;
-        border: 1px solid #555555;
-        border-radius: 5px;
-        margin-top: 10px;
-        padding-top: 10px;
-    }
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 10px;
-        padding: 0 3px 0 3px;
-    }
-    QScrollArea {
-        background-color: #2d2d2d;
-    }
-    QLabel {
-        color: #ffffff;
-    }
-    QDialog {
-        background-color: #2d2d2d;
-    }
-    """
+    @classmethod
+    def _load_stylesheet(cls, name: str) -> str:
+        """Read a stylesheet from assets, collapsing its indentation and newlines."""
+        sheet = cls._stylesheets.get(name)
+        if sheet is None:
+            try:
+                text = (cls.ASSETS_DIR / f"{name}.qss").read_text(encoding="utf-8")
+            except OSError as e:
+                print(f"Error loading {name} stylesheet: {e}")
+                text = ""
+            sheet = "".join(line.strip() for line in text.splitlines())
+            cls._stylesheets[name] = sheet
+        return sheet
     
     def __init__(self):
         """Initialize theme service."""
         self.settings = QSettings("SCUM", "ServerTracker")
         self.current_theme = self._load_theme()
+        # Resolved stylesheet; detecting the system theme asks the OS, so it
+        # is only redone after the preference or the system scheme changes
+        self._cached_sheet = None
+        
+        # Qt 6.5+ reports system light/dark switches
+        app = QGuiApplication.instance()
+        style_hints = app.styleHints() if app else None
+        if style_hints is not None and hasattr(style_hints, "colorSchemeChanged"):
+            style_hints.colorSchemeChanged.connect(self._invalidate_stylesheet)
     
     def _load_theme(self) -> Theme:
         """Load saved theme preference."""
@@ -225,28 +56,40 @@ class ThemeService:
         except ValueError:
             return Theme.SYSTEM
     
+    def _invalidate_stylesheet(self, *args) -> None:
+        """Forget the resolved stylesheet so it is recomputed on next use."""
+        self._cached_sheet = None
+    
     def save_theme(self, theme: Theme) -> None:
         """Save theme preference."""
         self.settings.setValue("theme", theme.value)
         self.current_theme = theme
+        self._cached_sheet = None
     
-    def get_stylesheet(self) -> str:
-        """Get the appropriate stylesheet based on current theme."""
+    def is_dark(self) -> bool:
+        """Check whether the current theme resolves to dark."""
         if self.current_theme == Theme.LIGHT:
-            return self.LIGHT_STYLESHEET
+            return False
         elif self.current_theme == Theme.DARK:
-            return self.DARK_STYLESHEET
+            return True
         else:  # SYSTEM
             # Detect system theme using darkdetect
-            import darkdetect
             try:
-                is_dark = darkdetect.isDark()
-                return self.DARK_STYLESHEET if is_dark else self.LIGHT_STYLESHEET
+                return bool(darkdetect.isDark())
             except Exception:
                 # Fallback to light if detection fails
-                return self.LIGHT_STYLESHEET
+                return False
+    
+    def get_stylesheet(self) -> str:
+        """Get the appropriate stylesheet based on current theme."""
+        if self._cached_sheet is None:
+            self._cached_sheet = self._load_stylesheet("dark" if self.is_dark() else "light")
+        return self._cached_sheet
     
     def apply_theme(self, app) -> None:
-        """Apply theme to the application."""
+        """Apply theme to the application (or a single widget)."""
         stylesheet = self.get_stylesheet()
-        app.setStyleSheet(stylesheet)
+        # Setting a stylesheet re-polishes every widget, even when it's the
+        # same sheet, so skip it if nothing would change
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
@@ -3,33 +3,41 @@ Main application window
 """
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QPushButton, QLineEdit,
+    QTableView, QPushButton, QLineEdit,
     QCheckBox, QSpinBox, QLabel, QDialog, QTextEdit, QScrollArea, QGroupBox, QMenu, QAbstractItemDelegate, QFrame,
-    QApplication, QMessageBox, QComboBox, QStyledItemDelegate
+    QApplication, QMessageBox, QComboBox, QStyledItemDelegate, QStyle, QStyleOptionButton,
+    QStyleOptionViewItem, QGraphicsOpacityEffect
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup, QPoint
-from PyQt6.QtGui import QFont, QColor, QAction, QPixmap, QPainter, QPen, QBrush, QStandardItemModel, QStandardItem
-from functools import cmp_to_key
+from PyQt6.QtCore import Qt, QEvent, QProcess, QUrl, QTimer, pyqtSignal, QThread, QMutex, QWaitCondition, QAbstractTableModel, QModelIndex, QSize, QPropertyAnimation, QEasingCurve, QPoint
+from PyQt6.QtGui import QFont, QColor, QAction, QDesktopServices, QPixmap, QPainter, QPen, QBrush, QStandardItemModel, QStandardItem, QPalette, QTextDocument, QTextOption
+from functools import cmp_to_key, lru_cache
+from types import MappingProxyType
 from datetime import datetime
-from typing import List
-import matplotlib
-matplotlib.use('Qt5Agg')  # Set backend before importing pyplot
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from scipy.interpolate import make_interp_spline, UnivariateSpline
+from typing import List, Optional
 import numpy as np
 import subprocess
 import platform
+import json
+import mmap
 import os
+import re
+import stat
 
-from scum_tracker.models.server import GameServer, PingRecord
+from scum_tracker.models.server import GameServer, PingRecord, ServerTable
 from scum_tracker.models.database import Database
 from scum_tracker.services.server_manager import ServerManager
 from scum_tracker.services.ping_service import PingService
 from scum_tracker.services.theme_service import ThemeService, Theme
 from scum_tracker.services.desktop_integration import DesktopIntegration
 
+# Operating system name ("Linux", "Windows", "Darwin"); it can't change while running
+_PLATFORM = platform.system()
+
+# Bundled images and data files (scum_tracker/assets)
+_ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+_CONNECTION_GUIDE_PATH = os.path.join(_ASSETS_DIR, "connection_guide.png")
+_CONNECTION_GUIDE_300_PATH = os.path.join(_ASSETS_DIR, "connection_guide_300.png")  # Pre-scaled copy
+
 # Country to continent mapping
 COUNTRY_TO_CONTINENT = {
     # North America
@@ -52,10 +60,23 @@ COUNTRY_TO_CONTINENT = {
     "ZA": "Africa", "EG": "Africa", "NG": "Africa",
 }
 
+# Reverse of COUNTRY_TO_CONTINENT: region name -> its country codes
+REGION_TO_COUNTRIES = {}
+for _country, _region in COUNTRY_TO_CONTINENT.items():
+    REGION_TO_COUNTRIES.setdefault(_region, set()).add(_country)
+REGION_TO_COUNTRIES = {region: frozenset(countries) for region, countries in REGION_TO_COUNTRIES.items()}
+del _country, _region
+
 
 class CustomCheckBox(QCheckBox):
     """Custom checkbox with visible painted checkmark"""
     
+    # Pens for each theme, shared by every checkbox
+    _BORDER_LIGHT = QPen(QColor("#cccccc"), 1)
+    _BORDER_DARK = QPen(QColor("#555555"), 1)
+    _CHECK_LIGHT = QPen(QColor("#4CAF50"), 2.5)
+    _CHECK_DARK = QPen(QColor("#4CCA50"), 2.5)
+    
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(24)
@@ -66,6 +87,24 @@ class CustomCheckBox(QCheckBox):
         # Set minimum width based on checkbox + text
         if text:
             self.setMinimumWidth(70)
+        self._update_pens()
+    
+    def _update_pens(self):
+        """Pick the pens for the current theme (from the palette)"""
+        text_color = self.palette().color(self.foregroundRole())
+        if text_color.red() > 128:
+            # Light theme
+            self._border_pen, self._check_pen = self._BORDER_LIGHT, self._CHECK_LIGHT
+        else:
+            # Dark theme
+            self._border_pen, self._check_pen = self._BORDER_DARK, self._CHECK_DARK
+        self._text_pen = QPen(text_color)
+    
+    def changeEvent(self, event):
+        """Re-pick the pens when the theme changes the palette"""
+        if event.type() == QEvent.Type.PaletteChange:
+            self._update_pens()
+        super().changeEvent(event)
     
     def paintEvent(self, event):
         """Paint checkbox with custom checkmark"""
@@ -77,23 +116,13 @@ class CustomCheckBox(QCheckBox):
         box_x = 2
         box_y = (self.height() - box_size) // 2
         
-        # Determine colors based on theme
-        if self.palette().color(self.foregroundRole()).red() > 128:
-            # Light theme
-            border_color = QColor("#cccccc")
-            check_color = QColor("#4CAF50")
-        else:
-            # Dark theme
-            border_color = QColor("#555555")
-            check_color = QColor("#4CCA50")
-        
         # Draw checkbox box
-        painter.setPen(QPen(border_color, 1))
+        painter.setPen(self._border_pen)
         painter.drawRect(box_x, box_y, box_size, box_size)
         
         # Draw checkmark if checked
         if self.isChecked():
-            painter.setPen(QPen(check_color, 2.5))
+            painter.setPen(self._check_pen)
             painter.drawLine(box_x + 4, box_y + 10, box_x + 8, box_y + 14)
             painter.drawLine(box_x + 8, box_y + 14, box_x + 15, box_y + 6)
         
@@ -101,7 +130,7 @@ class CustomCheckBox(QCheckBox):
         text_x = box_x + box_size + 8
         text_y = self.height() // 2
         
-        painter.setPen(QPen(self.palette().color(self.foregroundRole())))
+        painter.setPen(self._text_pen)
         painter.setFont(self.font())
         
         # Draw text aligned to the middle
@@ -120,7 +149,7 @@ class ServerFetchWorker(QThread):
     def run(self):
         try:
             servers = ServerManager.fetch_servers()
-            favorites = self.db.get_favorites()
+            favorites = set(self.db.get_favorites())
             
             for server in servers:
                 server.is_favorite = server.id in favorites
@@ -135,71 +164,404 @@ class PingWorker(QThread):
     """Worker thread for pinging servers"""
     ping_completed = pyqtSignal(str, int, bool)  # server_id, latency, success
     
-    def __init__(self, server: GameServer):
+    def __init__(self, servers: List[GameServer]):
         super().__init__()
-        self.server = server
+        self.servers = servers
     
     def run(self):
-        result = PingService.ping_server(self.server.ip, self.server.port)
+        # One batched sweep; each result is emitted as soon as it arrives
+        PingService.ping_many(
+            [(server.ip, server.port) for server in self.servers],
+            on_result=self._emit_result
+        )
+    
+    def _emit_result(self, index: int, result: PingRecord):
         self.ping_completed.emit(
-            self.server.id,
+            self.servers[index].id,
             result.latency if result.latency > 0 else 0,
             result.success
         )
 
 
-class NumericTableItem(QTableWidgetItem):
-    """Table item that sorts numerically"""
-    def __init__(self, display_text: str, numeric_value: int):
-        super().__init__(display_text)
-        self.numeric_value = numeric_value
-    
-    def __lt__(self, other):
-        """Override less-than for numeric sorting"""
-        if isinstance(other, NumericTableItem):
-            return self.numeric_value < other.numeric_value
-        return super().__lt__(other)
-
-
 class PingItemDelegate(QAbstractItemDelegate):
     """Custom delegate for rendering ping values with color coding"""
+    
+    # (text color, translucent background) for green, orange and red
+    COLORS = (
+        (QColor("#00AA00"), QColor(0x00, 0xAA, 0x00, 30)),
+        (QColor("#FF9900"), QColor(0xFF, 0x99, 0x00, 30)),
+        (QColor("#FF0000"), QColor(0xFF, 0x00, 0x00, 30)),
+    )
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bold_font = None
+    
     def paint(self, painter, option, index):
         """Paint the ping item with color coding"""
-        text = index.data()
-        
-        # Extract latency value from text (e.g., "19ms" -> 19)
-        try:
-            latency = int(str(text).rstrip('ms'))
-        except (ValueError, AttributeError, TypeError):
-            # Fall back to default rendering for non-numeric items
+        latency = index.data(ServerTableModel.LATENCY_ROLE)
+        if latency is None:
+            # Nothing to draw for servers without a ping
             return
         
         # Determine color based on latency
         if latency < 100:
-            color = QColor("#00AA00")  # Green
+            color, background = self.COLORS[0]  # Green
         elif latency < 200:
-            color = QColor("#FF9900")  # Orange
+            color, background = self.COLORS[1]  # Orange
         else:
-            color = QColor("#FF0000")  # Red
+            color, background = self.COLORS[2]  # Red
         
         # Draw background
-        painter.fillRect(option.rect, QColor(color.red(), color.green(), color.blue(), 30))
+        painter.fillRect(option.rect, background)
         
         # Draw text
+        if self._bold_font is None:
+            self._bold_font = QFont(painter.font())
+            self._bold_font.setBold(True)
         painter.setPen(color)
-        font = painter.font()
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(option.rect, int(Qt.AlignmentFlag.AlignCenter), str(text))
+        painter.setFont(self._bold_font)
+        painter.drawText(option.rect, int(Qt.AlignmentFlag.AlignCenter), index.data())
     
     def sizeHint(self, option, index):
         """Return size hint for the item"""
         return option.rect.size()
 
 
-class NumericSortTableWidget(QTableWidget):
-    """Custom table widget with proper numeric sorting"""
-    pass
+# Latency colors: green under 100ms, orange under 200ms, red above
+_LATENCY_COLORS = ("#00AA00", "#FF9900", "#FF0000")
+
+
+def _latency_color_hex(latency: int) -> str:
+    """Color for a latency value: green, orange or red"""
+    return _LATENCY_COLORS[(latency >= 100) + (latency >= 200)]
+
+
+# Ping history preview: min/max/avg, each colored by latency
+_HISTORY_HTML = (
+    '<span style="color: {0};">{1}</span>/'
+    '<span style="color: {2};">{3}</span>/'
+    '<span style="color: {4};">{5:.0f}ms</span>'
+).format
+
+
+@lru_cache(maxsize=4096)
+def _history_stats_html(min_lat: int, max_lat: int, avg_lat: float) -> str:
+    """Colored min/max/avg preview; cached since most stats don't change between refreshes"""
+    return _HISTORY_HTML(_latency_color_hex(min_lat), min_lat, _latency_color_hex(max_lat), max_lat,
+                         _latency_color_hex(avg_lat), avg_lat)
+
+
+def _pchip_end_slope(h0: float, h1: float, secant0: float, secant1: float) -> float:
+    """Shape-preserving three-point slope for an end of a monotone cubic"""
+    slope = ((2 * h0 + h1) * secant0 - h0 * secant1) / (h0 + h1)
+    if np.sign(slope) != np.sign(secant0):
+        return 0.0
+    if np.sign(secant0) != np.sign(secant1) and abs(slope) > abs(3 * secant0):
+        return 3 * secant0
+    return slope
+
+
+def _monotone_cubic(x: np.ndarray, y: np.ndarray, x_new: np.ndarray) -> np.ndarray:
+    """
+    Monotone cubic Hermite (PCHIP) interpolation of y(x) at x_new
+    
+    Fritsch-Carlson slopes keep the curve from overshooting the data, so a
+    smoothed ping line never dips below the lowest ping between two points.
+    
+    Args:
+        x: Strictly increasing sample positions (at least 3)
+        y: Sample values
+        x_new: Positions to evaluate, within [x[0], x[-1]]
+    
+    Returns:
+        Interpolated values at x_new
+    """
+    h = np.diff(x)
+    secant = np.diff(y) / h
+    
+    # Interior slopes: weighted harmonic mean of the neighbouring secants,
+    # or flat at local extrema (where the secants change sign)
+    slopes = np.zeros_like(y, dtype=float)
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = secant[:-1] * secant[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / secant[:-1] + w2 / secant[1:])
+    slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+    slopes[0] = _pchip_end_slope(h[0], h[1], secant[0], secant[1])
+    slopes[-1] = _pchip_end_slope(h[-1], h[-2], secant[-1], secant[-2])
+    
+    # Evaluate the Hermite basis on each point's interval
+    i = np.clip(np.searchsorted(x, x_new, side='right') - 1, 0, len(h) - 1)
+    t = (x_new - x[i]) / h[i]
+    t2 = t * t
+    t3 = t2 * t
+    return ((2 * t3 - 3 * t2 + 1) * y[i] + (t3 - 2 * t2 + t) * h[i] * slopes[i]
+            + (3 * t2 - 2 * t3) * y[i + 1] + (t3 - t2) * h[i] * slopes[i + 1])
+
+
+class ServerTableModel(QAbstractTableModel):
+    """
+    Table model for the displayed servers
+    
+    Cells are produced on demand from the GameServer objects when the view
+    paints them, so a refresh creates no per-cell items or widgets.
+    """
+    
+    HEADERS = ["★", "Server Name", "Players", "Ping (ms)", "Region", "IP:Port", "History"]
+    REGION_TOOLTIP = "Country and region data is provided by BattleMetrics using GeoIP. Accuracy is not guaranteed."
+    EMPTY_MESSAGE = "No servers found. Try adjusting your search terms or filter settings."
+    
+    # Ping column: latency as an int (None when not pinged) for PingItemDelegate
+    LATENCY_ROLE = Qt.ItemDataRole.UserRole + 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._servers: List[GameServer] = []
+        self._rows_by_id = {}  # server_id -> row
+        self._history_stats = {}
+        self._light_theme = True
+        self._sort_column = None
+        self.show_empty_message = False
+    
+    def set_servers(self, servers: List[GameServer], history_stats: dict, light_theme: bool):
+        """
+        Replace the displayed servers (already filtered and sorted)
+        
+        When the same servers come back in the same order (e.g. a refresh after
+        pings that didn't reorder anything), the rows are updated in place, so
+        the selection and scroll position are kept. Otherwise the model resets.
+        """
+        same_rows = bool(servers) and (
+            [server.id for server in servers] == [server.id for server in self._servers]
+        )
+        
+        if same_rows:
+            self._servers = servers
+            self._history_stats = history_stats
+            self._light_theme = light_theme
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(servers) - 1, len(self.HEADERS) - 1))
+            return
+        
+        self.beginResetModel()
+        self._servers = servers
+        self._rows_by_id = {server.id: row for row, server in enumerate(servers)}
+        self._history_stats = history_stats
+        self._light_theme = light_theme
+        self.show_empty_message = not servers
+        self.endResetModel()
+    
+    def server_at(self, row: int) -> Optional[GameServer]:
+        """Get the server shown in a row, or None (e.g. for the empty message)"""
+        if 0 <= row < len(self._servers):
+            return self._servers[row]
+        return None
+    
+    def has_history(self, server_id: str) -> bool:
+        """Check whether a server has ping history stats to show"""
+        return server_id in self._history_stats
+    
+    def refresh_servers(self, server_ids, column: int):
+        """Repaint one column for the given servers, if they are displayed"""
+        for server_id in server_ids:
+            row = self._rows_by_id.get(server_id)
+            if row is not None:
+                index = self.index(row, column)
+                self.dataChanged.emit(index, index)
+    
+    def set_sort_column(self, column: int):
+        """Set which header is shown in bold"""
+        self._sort_column = column
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.HEADERS) - 1)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._servers) or (1 if self.show_empty_message else 0)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def flags(self, index):
+        if self.server_at(index.row()) is None:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.ItemDataRole.ToolTipRole and section == 4:
+            return self.REGION_TOOLTIP
+        if role == Qt.ItemDataRole.FontRole:
+            font = QFont()
+            font.setBold(section == self._sort_column)
+            return font
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        server = self.server_at(index.row())
+        column = index.column()
+        
+        if server is None:
+            # Empty state message (spans all columns)
+            if column != 0:
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.EMPTY_MESSAGE
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setItalic(True)
+                return font
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:  # Star
+                return "★" if server.is_favorite else "☆"
+            elif column == 1:  # Server name
+                return server.name
+            elif column == 2:  # Players
+                return f"{server.players}/{server.max_players}"
+            elif column == 3:  # Ping
+                if server.latency is not None and server.latency > 0:
+                    return f"{server.latency}ms"
+                return "N/A"
+            elif column == 4:  # Region - show region continent and country code together
+                continent = COUNTRY_TO_CONTINENT.get(server.region)
+                return f"{continent}: {server.region}" if continent else f"{server.region}"
+            elif column == 5:  # IP:Port
+                return f"{server.ip}:{server.port}"
+            elif column == 6:  # History (rich text, drawn by HistoryItemDelegate)
+                return self._history_html(self._history_stats.get(server.id))
+        elif role == self.LATENCY_ROLE and column == 3:
+            if server.latency is not None and server.latency > 0:
+                return server.latency
+            return None
+        elif role == Qt.ItemDataRole.ForegroundRole and column == 0 and server.is_favorite:
+            # Use darker color for light theme, gold for dark theme
+            return QColor("#CC8800") if self._light_theme else QColor("gold")
+        elif role == Qt.ItemDataRole.FontRole and column == 0 and server.is_favorite and self._light_theme:
+            font = QFont()
+            font.setBold(True)
+            return font
+        elif role == Qt.ItemDataRole.ToolTipRole and column == 6 and server.id in self._history_stats:
+            return "Click to see ping history"
+        return None
+    
+    @staticmethod
+    def _history_html(stats: Optional[dict]) -> str:
+        """Build the ping history preview (min/max/avg and time since last ping)"""
+        if not stats:
+            return "No data"
+        
+        min_lat = stats['min']
+        max_lat = stats['max']
+        avg_lat = stats['avg']
+        last_timestamp = stats.get('last_timestamp')
+        
+        # Calculate time since last ping (only if needed for display)
+        time_ago = ""
+        if last_timestamp:
+            seconds = (datetime.now() - last_timestamp).total_seconds()
+            if seconds < 60:
+                time_ago = f"{int(seconds)}s"
+            elif seconds < 3600:
+                time_ago = f"{int(seconds / 60)}m"
+            else:
+                time_ago = f"{int(seconds / 3600)}h"
+        
+        # Combine stats and time on one line
+        preview_html = _history_stats_html(min_lat, max_lat, avg_lat)
+        if time_ago:
+            preview_html += f' <span style="color: #888;">({time_ago})</span>'
+        return preview_html
+
+
+class StarItemDelegate(QStyledItemDelegate):
+    """Draws the favorite star cell as a button"""
+    def paint(self, painter, option, index):
+        # Button frame from the style, star drawn on top so stylesheet
+        # button colors don't override the favorite color
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        button.palette = option.palette
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+        
+        painter.save()
+        font = index.data(Qt.ItemDataRole.FontRole)
+        if font is not None:
+            painter.setFont(font)
+        color = index.data(Qt.ItemDataRole.ForegroundRole)
+        painter.setPen(color if color is not None else option.palette.color(QPalette.ColorRole.ButtonText))
+        painter.drawText(button.rect, int(Qt.AlignmentFlag.AlignCenter), index.data() or "")
+        painter.restore()
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Renders the rich text ping history preview"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._size_hints = {}  # html -> QSize; previews repeat a lot across rows
+        # (html, text color, width) -> laid out document, reused across repaints
+        # the way a per-row label would be, without a widget per row
+        self._documents = {}
+    
+    @staticmethod
+    def _document(html: str, color: str = "#000000") -> QTextDocument:
+        """Lay out a preview as a small centered text document"""
+        doc = QTextDocument()
+        doc.setDefaultStyleSheet(f"body {{ font-size: 8px; color: {color}; }}")
+        doc.setDefaultTextOption(QTextOption(Qt.AlignmentFlag.AlignCenter))
+        doc.setDocumentMargin(1)
+        doc.setHtml(f"<body>{html}</body>")
+        return doc
+    
+    def paint(self, painter, option, index):
+        # Let the base class draw the background/selection, then the text on top
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        html = option.text
+        option.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+        
+        color = option.palette.color(QPalette.ColorRole.Text).name()
+        key = (html, color, option.rect.width())
+        doc = self._documents.get(key)
+        if doc is None:
+            if len(self._documents) > 1024:
+                self._documents.clear()
+            doc = self._document(html, color)
+            doc.setTextWidth(option.rect.width())
+            self._documents[key] = doc
+        
+        painter.save()
+        y_offset = max(0, (option.rect.height() - doc.size().height()) / 2)
+        painter.translate(option.rect.left(), option.rect.top() + y_offset)
+        doc.drawContents(painter)
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        """Size of the rendered preview, not of its HTML source"""
+        html = index.data() or ""
+        size = self._size_hints.get(html)
+        if size is None:
+            if len(self._size_hints) > 4096:
+                self._size_hints.clear()
+            doc = self._document(html)
+            size = QSize(int(doc.idealWidth()) + 4, int(doc.size().height()) + 4)
+            self._size_hints[html] = size
+        return size
 
 
 class SpinningCheckBox(CustomCheckBox):
@@ -233,128 +595,303 @@ class AnimatedIndicator(QLabel):
         self.setFixedWidth(20)
         self.setVisible(False)
         
-        # Create pulsing animation
-        self.animation = QPropertyAnimation(self, b"opacity")
-        self.animation.setDuration(800)
-        self.animation.setStartValue(0.3)
-        self.animation.setEndValue(1.0)
-        self.animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        
-        # Create looping animation
-        self.anim_group = QSequentialAnimationGroup()
-        self.anim_group.addAnimation(self.animation)
-        
-        # Create reverse animation
-        self.animation_reverse = QPropertyAnimation(self, b"opacity")
-        self.animation_reverse.setDuration(800)
-        self.animation_reverse.setStartValue(1.0)
-        self.animation_reverse.setEndValue(0.3)
-        self.animation_reverse.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        self.anim_group.addAnimation(self.animation_reverse)
-        self.anim_group.setLoopCount(-1)  # Loop forever
-        
-        self._opacity = 1.0
-    
-    def setOpacity(self, value):
-        """Set opacity for animation"""
-        self._opacity = value
-        self.setStyleSheet(f"color: #4CAF50; font-size: 12px; opacity: {value};")
+        # Pulse by animating an opacity effect (no stylesheet re-parse per frame):
+        # one looping animation fading out and back in
+        self._effect = QGraphicsOpacityEffect(self)
+        self.setGraphicsEffect(self._effect)
+        self.animation = QPropertyAnimation(self._effect, b"opacity", self)
+        self.animation.setDuration(1600)
+        self.animation.setKeyValueAt(0.0, 0.3)
+        self.animation.setKeyValueAt(0.5, 1.0)
+        self.animation.setKeyValueAt(1.0, 0.3)
+        self.animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self.animation.setLoopCount(-1)  # Loop forever
     
     def start_animation(self):
         """Start pulsing animation"""
         self.setVisible(True)
-        self.anim_group.start()
+        self.animation.start()
     
     def stop_animation(self):
         """Stop pulsing animation"""
-        self.anim_group.stop()
+        self.animation.stop()
         self.setVisible(False)
 
 
 class DisplayWorker(QThread):
-    """Worker thread for filtering and sorting servers asynchronously"""
+    """
+    Long-lived worker thread for filtering and sorting servers asynchronously
+    
+    submit() hands over the latest filter state and wakes the thread. Requests
+    that arrive while a pass is running replace each other, so only the most
+    recent one is filtered next, and the running pass's result is dropped.
+    """
     display_ready = pyqtSignal(list)  # Emits filtered and sorted servers
     
-    def __init__(self, servers, search_text, favorites_only, region_name, max_ping,
-                 hide_empty, hide_full, sort_column, sort_order, db):
+    def __init__(self):
         super().__init__()
-        self.servers = servers
-        self.search_text = search_text
-        self.favorites_only = favorites_only
-        self.region_name = region_name
-        self.max_ping = max_ping
-        self.hide_empty = hide_empty
-        self.hide_full = hide_full
-        self.sort_column = sort_column
-        self.sort_order = sort_order
-        self.db = db
+        self._mutex = QMutex()
+        self._cond = QWaitCondition()
+        self._pending = None  # Arguments for the next _filter_and_sort call
+        self._stop = False
+    
+    def submit(self, servers, table, search_text, favorites_only, region_name, max_ping,
+               hide_empty, hide_full, sort_column, sort_order):
+        """Queue a filter pass, replacing any that hasn't started yet"""
+        self._mutex.lock()
+        self._pending = (servers, table, search_text, favorites_only, region_name, max_ping,
+                         hide_empty, hide_full, sort_column, sort_order)
+        self._cond.wakeOne()
+        self._mutex.unlock()
+    
+    def stop(self):
+        """Ask the thread to exit once the current pass (if any) finishes"""
+        self._mutex.lock()
+        self._stop = True
+        self._cond.wakeOne()
+        self._mutex.unlock()
     
     def run(self):
-        """Filter, sort, and prepare servers for display"""
-        # Build list of countries from selected region
-        selected_countries = []
-        if self.region_name != "All Regions":
-            for country, region in COUNTRY_TO_CONTINENT.items():
-                if region == self.region_name:
-                    selected_countries.append(country)
-        
-        # Filter servers
-        filtered = []
-        for server in self.servers:
-            # Favorites filter
-            if self.favorites_only and not server.is_favorite:
-                continue
-            
-            # Search filter
-            if self.search_text and self.search_text not in server.name.lower():
-                continue
-            
-            # Region filter
-            if selected_countries and server.region not in selected_countries:
-                continue
-            
-            # Ping filter - max ping only
-            if server.latency is not None and server.latency > 0:
-                if server.latency > self.max_ping:
-                    continue
-            
-            # Player count filter
-            if self.hide_empty and server.players == 0:
-                continue
-            if self.hide_full and server.players >= server.max_players:
-                continue
+        """Wait for submitted filter state and emit the result of each pass"""
+        while True:
+            self._mutex.lock()
+            while self._pending is None and not self._stop:
+                self._cond.wait(self._mutex)
+            if self._stop:
+                self._mutex.unlock()
+                return
+            params = self._pending
+            self._pending = None
+            self._mutex.unlock()
             
-            filtered.append(server)
+            try:
+                result = self._filter_and_sort(*params)
+                # A newer request came in meanwhile: its pass runs next, so don't
+                # make the GUI rebuild the table for this stale one
+                if self._pending is None:
+                    self.display_ready.emit(result)
+            except Exception as e:
+                # Keep the thread alive for the next filter change
+                print(f"Error filtering servers: {e}")
+    
+    @staticmethod
+    def _filter_and_sort(servers, table, search_text, favorites_only, region_name, max_ping,
+                         hide_empty, hide_full, sort_column, sort_order) -> List[GameServer]:
+        """Filter, sort, and prepare servers for display"""
+        if table is None or len(table) != len(servers):
+            table = ServerTable.from_servers(servers)
+        
+        # The GUI thread keeps pings and favorites current in the table, so take
+        # a snapshot of them for this pass
+        latency = table.pings.copy()
+        favorite = table.favorites.copy()
+        
+        # Countries in the selected region (empty for "All Regions")
+        selected_countries = REGION_TO_COUNTRIES.get(region_name, frozenset())
+        
+        # Filter servers - one boolean mask per filter, over whole columns
+        mask = np.ones(len(servers), dtype=bool)
+        
+        # Favorites filter
+        if favorites_only:
+            mask &= favorite
+        
+        # Search filter
+        if search_text:
+            mask &= np.char.find(table.names_lower, search_text) >= 0
+        
+        # Region filter
+        if selected_countries:
+            mask &= np.isin(table.countries, list(selected_countries))
+        
+        # Ping filter - max ping only (unpinged servers always pass)
+        mask &= (latency <= 0) | (latency <= max_ping)
+        
+        # Player count filter
+        if hide_empty:
+            mask &= table.players != 0
+        if hide_full:
+            mask &= table.players < table.max_players
+        
+        order = np.flatnonzero(mask)
         
         # Sort servers
-        sort_reverse = self.sort_order == Qt.SortOrder.DescendingOrder
+        sort_reverse = sort_order == Qt.SortOrder.DescendingOrder
         
-        if self.sort_column == 0:  # Star (favorites)
+        sort_key = None
+        if sort_column == 0:  # Star (favorites)
             pass
-        elif self.sort_column == 1:  # Server Name
-            filtered = sorted(filtered, key=lambda s: s.name.lower(), reverse=sort_reverse)
-        elif self.sort_column == 2:  # Players
-            filtered = sorted(filtered, key=lambda s: s.players, reverse=sort_reverse)
-        elif self.sort_column == 3:  # Ping
-            filtered = sorted(filtered, key=lambda s: s.latency if s.latency else 999999, reverse=sort_reverse)
-        elif self.sort_column == 4:  # Region
+        elif sort_column == 1:  # Server Name
+            sort_key = table.names_lower
+        elif sort_column == 2:  # Players
+            sort_key = table.players
+        elif sort_column == 3:  # Ping
+            sort_key = np.where(latency != 0, latency, 999999)
+        elif sort_column == 4:  # Region
             pass
-        elif self.sort_column == 5:  # IP:Port
+        elif sort_column == 5:  # IP:Port
             pass
-        elif self.sort_column == 6:  # History
+        elif sort_column == 6:  # History
             pass
         
+        if sort_key is not None:
+            keys = sort_key[order]
+            if sort_reverse:
+                # Stable descending sort: ties keep their original order
+                order = order[::-1][np.argsort(keys[::-1], kind='stable')[::-1]]
+            else:
+                order = order[np.argsort(keys, kind='stable')]
+        
         # Keep favorites on top
-        favorites = [s for s in filtered if s.is_favorite]
-        non_favorites = [s for s in filtered if not s.is_favorite]
-        filtered = favorites + non_favorites
+        on_top = favorite[order]
+        order = np.concatenate((order[on_top], order[~on_top]))
         
-        # Emit result
-        self.display_ready.emit(filtered)
+        return [servers[i] for i in order]
+
+
+# Tokens of Valve's KeyValues text format: quoted strings and braces
+_VDF_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])')
+_VDF_ESCAPE = re.compile(r'\\(.)')
+
+# Version-like strings ("0.12.345", "1.1.0.5.101995") in a game executable or
+# start script, matched on its raw bytes. At least three parts, so stray
+# "1.0"-like byte runs in a binary don't count
+_VERSION_RE = re.compile(rb'(?<![\w.])\d+\.\d+\.\d+(?:\.\d+)*(?![\w.])')
+
+
+def _parse_vdf(text: str) -> dict:
+    """
+    Parse Valve KeyValues text (libraryfolders.vdf, appmanifest_*.acf)
+    
+    Returns nested dicts of strings. Keys are lowercased, since Steam doesn't
+    treat them case-sensitively (older files say "LibraryFolders").
+    """
+    root = {}
+    stack = [root]
+    key = None
+    for match in _VDF_TOKEN.finditer(text):
+        string, brace = match.groups()
+        if brace == '{':
+            child = {}
+            stack[-1][key or ''] = child
+            stack.append(child)
+            key = None
+        elif brace == '}':
+            if len(stack) > 1:
+                stack.pop()
+            key = None
+        elif key is None:
+            key = string.lower()
+        else:
+            stack[-1][key] = _VDF_ESCAPE.sub(r'\1', string)
+            key = None
+    return root
+
+
+def _load_build_correlations() -> MappingProxyType:
+    """
+    Load known Steam build ID -> SCUM version pairs from assets/build_map.json
+    
+    Kept in a data file so new correlations don't need a code change.
+    Build ID 21005454 = Stable 1.1.0.5.101995 (as of Dec 2025).
+    """
+    path = os.path.join(_ASSETS_DIR, "build_map.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            correlations = {str(build_id): str(version) for build_id, version in json.load(f).items()}
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"Error loading Steam build map: {e}")
+        correlations = {}
+    return MappingProxyType(correlations)
+
+
+# Read once at import; read-only afterwards
+_BUILD_CORRELATIONS = _load_build_correlations()
+
+
+class _StatCache:
+    """
+    Memoized path probes for one version detection pass
+    
+    Missing paths are remembered too, so anything beneath a directory that
+    was found missing is reported missing without touching the filesystem.
+    A directory can also be scanned once, after which its children are
+    answered from the listing instead of a stat per child.
+    Create a new one per pass so later passes see the current state.
+    """
+    
+    def __init__(self):
+        self._kinds = {}  # path -> "dir", "file", or None if missing
+        self._listings = {}  # scanned directory -> {normcased name: "dir" or "file"}
+    
+    def _kind(self, path: str) -> Optional[str]:
+        """Get whether a path is a "dir" or "file", or None if it doesn't exist"""
+        if path in self._kinds:
+            return self._kinds[path]
+        
+        listing = self._listings.get(os.path.dirname(path))
+        if listing is not None:
+            kind = listing.get(os.path.normcase(os.path.basename(path)))
+        else:
+            kind = None
+            ancestor = os.path.dirname(path)
+            while not (ancestor in self._kinds and self._kinds[ancestor] is None):
+                parent = os.path.dirname(ancestor)
+                if parent == ancestor:
+                    # No ancestor is known to be missing, so ask the filesystem
+                    try:
+                        kind = "dir" if stat.S_ISDIR(os.stat(path).st_mode) else "file"
+                    except OSError:
+                        pass
+                    break
+                ancestor = parent
+        
+        self._kinds[path] = kind
+        return kind
+    
+    def scan(self, directory: str) -> bool:
+        """
+        List a directory with one scandir, so probes of its children need no syscalls
+        
+        DirEntry already knows whether each entry is a directory (from readdir
+        on Linux, FindNextFile on Windows), so nothing is stat'ed per entry.
+        
+        Returns:
+            True if the directory exists and could be listed
+        """
+        if directory not in self._listings:
+            listing = None
+            if self._kinds.get(directory, "dir") is not None:
+                try:
+                    with os.scandir(directory) as entries:
+                        listing = {os.path.normcase(entry.name): "dir" if entry.is_dir() else "file"
+                                   for entry in entries}
+                except OSError:
+                    pass
+            self._listings[directory] = listing
+            self._kinds[directory] = "dir" if listing is not None else None
+        return self._listings[directory] is not None
+    
+    def exists(self, path: str) -> bool:
+        """Check if a path exists (like os.path.exists)"""
+        return self._kind(path) is not None
+    
+    def isdir(self, path: str) -> bool:
+        """Check if a path is a directory (like os.path.isdir)"""
+        return self._kind(path) == "dir"
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
+    
+    # Emitted once, after the first fetched server list has been displayed
+    ready = pyqtSignal()
+    
+    # Steam app ID of SCUM
+    SCUM_APP_ID = "513710"
+    
+    # Connection guide screenshot, scaled on first use (null if the image is missing)
+    _connection_guide_pixmap: Optional[QPixmap] = None
 
     def __init__(self):
         super().__init__()
@@ -370,17 +907,83 @@ class MainWindow(QMainWindow):
         self.db = Database()
         self.theme_service = ThemeService()
         self.servers: List[GameServer] = []
+        self.server_table = None  # ServerTable of self.servers, for filtering
+        self._server_by_id = {}  # server_id -> GameServer in self.servers
         self.displayed_servers: List[GameServer] = []  # Filtered/displayed servers for table
         self.ping_workers = []
         self.fetch_worker = None
-        self.display_worker = None  # Worker thread for filtering/sorting
+        # Worker thread for filtering/sorting, reused for every filter change
+        self.display_worker = DisplayWorker()
+        self.display_worker.display_ready.connect(self._on_display_ready, Qt.ConnectionType.QueuedConnection)
+        self.display_worker.start()
+        self._servers_loaded = False
+        self._ready_emitted = False
         self.pings_completed = 0
+        self._steam_libraries = None  # Filled in by _get_steam_libraries
+        
+        # Fonts for the connection dialog, shared by every dialog opened
+        self._connection_title_font = QFont()
+        self._connection_title_font.setPointSize(12)
+        self._connection_title_font.setWeight(QFont.Weight.Bold)
+        self._connection_text_font = QFont()
+        self._connection_text_font.setPointSize(10)
+        # Connection dialog, built on the first double-click and reused
+        self._connect_dialog = None
+        self._connect_title_label = None
+        self._connect_address_label = None
+        self._connect_server_info = ""  # Address shown in the dialog
+        self._clipboard = QApplication.clipboard()  # Server addresses are copied into it
         self.local_scum_version = self._get_local_scum_version()
         self.total_pings = 0
         
         # Timer for periodic display updates during pinging (updates in place without rebuilding)
         self.display_update_timer = QTimer()
         self.display_update_timer.timeout.connect(self._update_displayed_pings)
+        self._pending_ping_updates = set()  # server_ids pinged since the last update
+        
+        # Ping results are buffered and written to the database in batches
+        self._pending_ping_records: List[PingRecord] = []
+        
+        # Ping history stats shown in the table, kept between refreshes. Only
+        # servers with records written since they were loaded are re-queried.
+        self._history_stats = None  # server_id -> stats; None = load everything
+        self._stale_history_ids = set()
+        
+        # History graph, built by the first history dialog and reused by later ones
+        self._ping_fig = None
+        self._ping_ax = None
+        self._ping_line = None
+        self._ping_failed = None
+        self._ping_canvas = None
+        self._history_dialog = None
+        self._history_message = None  # Text shown when there's no graph
+        
+        self.ping_flush_timer = QTimer()
+        self.ping_flush_timer.setInterval(5000)
+        self.ping_flush_timer.timeout.connect(self._flush_ping_records)
+        
+        # Prune old ping history shortly after startup, then daily for long sessions
+        self.cleanup_timer = QTimer()
+        self.cleanup_timer.setInterval(24 * 60 * 60 * 1000)
+        self.cleanup_timer.timeout.connect(self._cleanup_ping_history)
+        self.cleanup_timer.start()
+        QTimer.singleShot(5000, self._cleanup_ping_history)
+        
+        # Typing in the search box or stepping the ping limit restarts this,
+        # so a burst of changes is saved and filtered once
+        self._filter_debounce = QTimer()
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(150)
+        self._filter_debounce.timeout.connect(self._apply_filter_now)
+        
+        # Filter changes only mark the settings dirty; they're written out a
+        # few seconds after the first change (and always on close)
+        self._filters_dirty = False
+        self._last_filter_fingerprint = None  # Filter state of the last pass submitted
+        self._filter_save_timer = QTimer()
+        self._filter_save_timer.setSingleShot(True)
+        self._filter_save_timer.setInterval(5000)
+        self._filter_save_timer.timeout.connect(self._maybe_flush_filters)
         
         # Delay auto-refresh slightly to let UI fully load
         self.auto_refresh_timer = QTimer()
@@ -397,6 +1000,11 @@ class MainWindow(QMainWindow):
         if not self.screenshot_mode:
             self._start_pinging()
 
+    def _cleanup_ping_history(self):
+        """Delete ping history older than 24 hours"""
+        if self.db.cleanup_old_records(days=1) > 0:
+            self._history_stats = None  # Stats may include deleted pings
+
     def closeEvent(self, event):
         """Clean up threads before closing"""
         # Save filter settings before closing
@@ -405,12 +1013,15 @@ class MainWindow(QMainWindow):
         # Stop display update timer
         if hasattr(self, 'display_update_timer'):
             self.display_update_timer.stop()
+        self.ping_flush_timer.stop()
+        self.cleanup_timer.stop()
+        self._filter_debounce.stop()
+        self._filter_save_timer.stop()
         
         # Stop and wait for display worker thread to finish
-        if self.display_worker and self.display_worker.isRunning():
-            self.display_worker.terminate()  # Force terminate if needed
-            if not self.display_worker.wait(1000):  # Wait 1 second
-                print("Warning: Display worker did not terminate cleanly")
+        self.display_worker.stop()
+        if not self.display_worker.wait(1000):  # Wait 1 second
+            print("Warning: Display worker did not terminate cleanly")
         
         # Stop and wait for ping workers with proper cleanup
         active_workers = [w for w in self.ping_workers if w and w.isRunning()]
@@ -429,6 +1040,9 @@ class MainWindow(QMainWindow):
             self.fetch_worker.terminate()
             self.fetch_worker.wait(1000)
         
+        self._flush_ping_records()
+        self.db.close()
+        
         super().closeEvent(event)
 
     def _set_theme(self, theme: Theme):
@@ -442,19 +1056,14 @@ class MainWindow(QMainWindow):
         from PyQt6.QtWidgets import QApplication
         app = QApplication.instance()
         if app:
-            app.setStyleSheet(self.theme_service.get_stylesheet())
+            self.theme_service.apply_theme(app)
         # Reapply to this window
-        self.setStyleSheet(self.theme_service.get_stylesheet())
+        self.theme_service.apply_theme(self)
 
     def _set_window_icon(self):
         """Set the application window icon"""
         from PyQt6.QtGui import QIcon
-        icon_path = os.path.join(
-            os.path.dirname(__file__), 
-            "..", 
-            "assets", 
-            "app_icon.png"
-        )
+        icon_path = os.path.join(_ASSETS_DIR, "app_icon.png")
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
     
@@ -466,7 +1075,7 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("&File")
         
         # Linux desktop integration (only show on Linux)
-        if platform.system() == "Linux":
+        if _PLATFORM == "Linux":
             desktop_integration = DesktopIntegration()
             
             if desktop_integration.is_installed():
@@ -549,26 +1158,51 @@ class MainWindow(QMainWindow):
             'region': self.region_filter.currentText(),
         }
         self.db.save_filter_settings(settings)
+        self._filters_dirty = False
+
+    def _maybe_flush_filters(self):
+        """Save filter settings if they changed since the last save"""
+        if self._filters_dirty:
+            self._save_filter_settings()
 
     def _load_filter_settings(self):
         """Load and apply saved filter settings from database"""
         settings = self.db.load_filter_settings()
         if settings:
-            # Apply saved values to UI controls
-            self.search_box.setText(settings.get('search_text', ''))
-            self.favorites_checkbox.setChecked(settings.get('favorites_only', False))
-            self.max_ping.setValue(settings.get('max_ping', 300))
-            self.hide_empty_checkbox.setChecked(settings.get('hide_empty', False))
-            self.hide_full_checkbox.setChecked(settings.get('hide_full', False))
-            
-            region = settings.get('region', 'All Regions')
-            index = self.region_filter.findText(region)
-            if index >= 0:
-                self.region_filter.setCurrentIndex(index)
+            # Apply saved values to UI controls. Their signals are blocked so
+            # this doesn't run (and re-save) a filter pass per control; the
+            # first pass happens once servers are loaded.
+            controls = (self.search_box, self.favorites_checkbox, self.max_ping,
+                        self.hide_empty_checkbox, self.hide_full_checkbox, self.region_filter)
+            for control in controls:
+                control.blockSignals(True)
+            try:
+                self.search_box.setText(settings.get('search_text', ''))
+                self.favorites_checkbox.setChecked(settings.get('favorites_only', False))
+                self.max_ping.setValue(settings.get('max_ping', 300))
+                self.hide_empty_checkbox.setChecked(settings.get('hide_empty', False))
+                self.hide_full_checkbox.setChecked(settings.get('hide_full', False))
+                
+                region = settings.get('region', 'All Regions')
+                index = self.region_filter.findText(region)
+                if index >= 0:
+                    self.region_filter.setCurrentIndex(index)
+            finally:
+                for control in controls:
+                    control.blockSignals(False)
 
     def _on_filter_changed(self):
-        """Called when any filter changes - saves settings and filters servers"""
-        self._save_filter_settings()
+        """Called while a typed filter changes - applies it once input settles"""
+        self._filter_debounce.start()
+
+    def _apply_filter_now(self):
+        """Filter servers and schedule a save of the filter settings"""
+        self._filter_debounce.stop()
+        if self._filter_fingerprint() == self._last_filter_fingerprint:
+            return  # e.g. a search typed and erased again within the debounce
+        self._filters_dirty = True
+        if not self._filter_save_timer.isActive():
+            self._filter_save_timer.start()
         self.filter_servers()
 
     def init_ui(self):
@@ -582,7 +1216,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout()
         
         # Apply initial theme
-        self.setStyleSheet(self.theme_service.get_stylesheet())
+        self.theme_service.apply_theme(self)
         
         # Header section
         header_layout = QHBoxLayout()
@@ -633,7 +1267,7 @@ class MainWindow(QMainWindow):
         filter_layout.addSpacing(10)
         
         self.favorites_checkbox = CustomCheckBox("Favorites Only")
-        self.favorites_checkbox.stateChanged.connect(self._on_filter_changed)
+        self.favorites_checkbox.stateChanged.connect(self._apply_filter_now)
         filter_layout.addWidget(self.favorites_checkbox)
         
         filter_layout.addSpacing(15)
@@ -652,11 +1286,11 @@ class MainWindow(QMainWindow):
         
         # Players filter - checkboxes instead of range
         self.hide_empty_checkbox = CustomCheckBox("Hide Empty")
-        self.hide_empty_checkbox.stateChanged.connect(self._on_filter_changed)
+        self.hide_empty_checkbox.stateChanged.connect(self._apply_filter_now)
         filter_layout.addWidget(self.hide_empty_checkbox)
         
         self.hide_full_checkbox = CustomCheckBox("Hide Full")
-        self.hide_full_checkbox.stateChanged.connect(self._on_filter_changed)
+        self.hide_full_checkbox.stateChanged.connect(self._apply_filter_now)
         filter_layout.addWidget(self.hide_full_checkbox)
         
         filter_layout.addSpacing(15)
@@ -674,7 +1308,7 @@ class MainWindow(QMainWindow):
         self.region_filter.addItem("Africa")
         self.region_filter.setToolTip("Country and region data is provided by BattleMetrics using GeoIP. Accuracy is not guaranteed.")
         self.region_filter.setMaximumWidth(140)
-        self.region_filter.currentTextChanged.connect(self._on_filter_changed)
+        self.region_filter.currentTextChanged.connect(self._apply_filter_now)
         filter_layout.addWidget(self.region_filter)
         
         # Add stretch to push refresh controls to the right
@@ -713,11 +1347,15 @@ class MainWindow(QMainWindow):
         layout.addLayout(filter_layout)
         
         # Server table
-        self.table = NumericSortTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "★", "Server Name", "Players", "Ping (ms)", "Region", "IP:Port", "History"
-        ])
+        self.table = QTableView()
+        self.table_model = ServerTableModel(self)
+        self.table.setModel(self.table_model)
+        # Star and history cells are painted by delegates rather than being
+        # a button/label widget per row
+        self.star_delegate = StarItemDelegate()
+        self.table.setItemDelegateForColumn(0, self.star_delegate)
+        self.history_delegate = HistoryItemDelegate()
+        self.table.setItemDelegateForColumn(6, self.history_delegate)
         
         # Set column widths
         # Column 0 (★): Fixed width just for the star
@@ -742,10 +1380,7 @@ class MainWindow(QMainWindow):
         # Column 4 (Region): Fixed width for region display
         self.table.setColumnWidth(4, 140)
         self.table.horizontalHeader().setSectionResizeMode(4, self.table.horizontalHeader().ResizeMode.Fixed)
-        # Add tooltip to Region column header
-        region_header = self.table.horizontalHeaderItem(4)
-        if region_header:
-            region_header.setToolTip("Country and region data is provided by BattleMetrics using GeoIP. Accuracy is not guaranteed.")
+        # The Region column header tooltip comes from ServerTableModel.headerData
         
         # Column 5 (IP:Port): Resizable to fit IP addresses properly
         self.table.setColumnWidth(5, 140)
@@ -768,6 +1403,7 @@ class MainWindow(QMainWindow):
         self.table.setEditTriggers(self.table.EditTrigger.NoEditTriggers)  # Disable cell editing
         self.table.horizontalHeader().sectionClicked.connect(self._on_table_sort)
         self.table.doubleClicked.connect(self._on_table_double_click)
+        self.table.clicked.connect(self._on_table_click)
         self.table_sort_column = 1  # Default sort by server name
         self.table_sort_order = Qt.SortOrder.AscendingOrder
         layout.addWidget(self.table)
@@ -809,7 +1445,6 @@ class MainWindow(QMainWindow):
 
     def _load_column_widths(self):
         """Load saved column widths from database"""
-        import json
         try:
             # Try to load from a simple config - for now, just use defaults
             # In future could store in database
@@ -819,10 +1454,9 @@ class MainWindow(QMainWindow):
 
     def _save_column_widths(self):
         """Save column widths to database for next session"""
-        import json
         try:
             # Get current column widths
-            widths = [self.table.columnWidth(i) for i in range(self.table.columnCount())]
+            widths = [self.table.columnWidth(i) for i in range(self.table_model.columnCount())]
             # Save to a simple JSON file for now
             import os
             config_dir = os.path.expanduser("~/.scum_tracker")
@@ -832,178 +1466,285 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error saving column widths: {e}")
 
+    def _get_steam_libraries(self, paths: _StatCache) -> List[str]:
+        """
+        Find the Steam library folders (each one holding a steamapps directory)
+        
+        Libraries are read from each Steam install's libraryfolders.vdf, plus
+        the usual default locations. The list is cached after the first call.
+        
+        Args:
+            paths: Stat cache for this detection pass
+        """
+        if self._steam_libraries is not None:
+            return self._steam_libraries
+        
+        if _PLATFORM == "Windows":
+            steam_roots = []
+            try:
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam") as key:
+                    steam_roots.append(winreg.QueryValueEx(key, "SteamPath")[0])
+            except OSError:
+                pass  # Steam not registered; try the default locations
+            steam_roots += [
+                os.path.expandvars(r"%ProgramFiles(x86)%\Steam"),
+                os.path.expandvars(r"%ProgramFiles%\Steam"),
+                os.path.expandvars(r"%UserProfile%\Desktop\steamcmd"),
+            ]
+        else:
+            # Common Steam locations on Linux/Mac (native, symlinked and Flatpak)
+            steam_roots = [
+                os.path.expanduser("~/.steam/steam"),
+                os.path.expanduser("~/.local/share/Steam"),
+                os.path.expanduser("~/.steam"),
+                os.path.expanduser("~/Steam"),
+                os.path.expanduser("~/.var/app/com.valvesoftware.Steam/data/Steam"),
+            ]
+        steam_roots.append("/mnt/ct2000/SteamLibrary")  # Custom mount
+        
+        libraries = []
+        seen = set()
+        
+        def add_library(path):
+            real_path = os.path.normcase(os.path.realpath(path))
+            if real_path not in seen and paths.isdir(os.path.join(path, "steamapps")):
+                seen.add(real_path)
+                libraries.append(path)
+        
+        for steam_root in steam_roots:
+            add_library(steam_root)
+            folders_file = os.path.join(steam_root, "steamapps", "libraryfolders.vdf")
+            if not paths.exists(folders_file):
+                continue
+            try:
+                with open(folders_file, "r", encoding="utf-8", errors="replace") as f:
+                    folders = _parse_vdf(f.read()).get("libraryfolders", {})
+            except OSError:
+                continue
+            for name, folder in folders.items():
+                if isinstance(folder, dict):
+                    # Current format: "0" { "path" "..." ... }
+                    if folder.get("path"):
+                        add_library(folder["path"])
+                elif name.isdigit():
+                    # Older format: "1" "D:\\SteamLibrary"
+                    add_library(folder)
+        
+        self._steam_libraries = libraries
+        return libraries
+
+    def _find_scum_manifest(self, paths: Optional[_StatCache] = None):
+        """
+        Find SCUM's app manifest in the Steam libraries
+        
+        Args:
+            paths: Stat cache for this detection pass (a fresh one if omitted)
+        
+        Returns:
+            (install directory, AppState dict) or None if SCUM's manifest isn't found
+        """
+        if paths is None:
+            paths = _StatCache()
+        for library in self._get_steam_libraries(paths):
+            manifest_path = os.path.join(library, "steamapps", f"appmanifest_{self.SCUM_APP_ID}.acf")
+            if not paths.exists(manifest_path):
+                continue
+            try:
+                with open(manifest_path, "r", encoding="utf-8", errors="replace") as f:
+                    app_state = _parse_vdf(f.read()).get("appstate", {})
+            except OSError:
+                continue
+            install_dir = os.path.join(library, "steamapps", "common", app_state.get("installdir") or "SCUM")
+            return install_dir, app_state
+        return None
+
+    @staticmethod
+    def _read_version_file(paths: _StatCache, version_file: str) -> Optional[str]:
+        """
+        Read a version.txt if it exists
+        
+        Args:
+            paths: Stat cache for this detection pass
+            version_file: Path to the version file
+        
+        Returns:
+            The version string, or None if the file is missing, unreadable or empty
+        """
+        if not paths.exists(version_file):
+            return None
+        try:
+            with open(version_file, "r") as f:
+                return f.read().strip() or None
+        except:
+            return None
+    
     def _get_local_scum_version(self) -> str:
         """Get the local SCUM version installed on Steam"""
         try:
-            if platform.system() == "Windows":
-                # Common Steam library paths on Windows
-                steam_paths = [
-                    os.path.expandvars(r"%ProgramFiles(x86)%\Steam\steamapps\common\SCUM"),
-                    os.path.expandvars(r"%ProgramFiles%\Steam\steamapps\common\SCUM"),
-                    os.path.expandvars(r"%UserProfile%\Desktop\steamcmd\steamapps\common\SCUM"),
-                    "/mnt/ct2000/SteamLibrary/steamapps/common/SCUM",  # Custom mount
-                ]
-            else:
-                # Common Steam library paths on Linux/Mac
-                steam_paths = [
-                    os.path.expanduser("~/.steam/steamapps/common/SCUM"),
-                    os.path.expanduser("~/Steam/steamapps/common/SCUM"),
-                    os.path.expanduser("~/.var/app/com.valvesoftware.Steam/data/Steam/steamapps/common/SCUM"),
-                    "/mnt/ct2000/SteamLibrary/steamapps/common/SCUM",  # Custom mount
-                ]
+            # Every probe below goes through one stat cache, so no path is
+            # stat'ed twice and nothing under a missing folder is stat'ed at all
+            paths = _StatCache()
             
-            # Also try to get Steam build ID from manifest to correlate with known versions
-            steam_build_id = self._get_steam_build_id()
+            # One listing per install folder answers all the probes for the files
+            # in it; folders that can't be listed are dropped here
+            steam_paths = []
+            for library in self._get_steam_libraries(paths):
+                steam_path = os.path.join(library, "steamapps", "common", "SCUM")
+                if steam_path not in steam_paths and paths.scan(steam_path):
+                    steam_paths.append(steam_path)
             
+            # Version files are the cheapest and most reliable source, so try
+            # them in every install before reading the app manifest
             for steam_path in steam_paths:
-                if not os.path.exists(steam_path):
-                    continue
-                    
-                # Try reading version.txt first (most reliable)
-                version_file = os.path.join(steam_path, "version.txt")
-                if os.path.exists(version_file):
-                    try:
-                        with open(version_file, "r") as f:
-                            version = f.read().strip()
-                            if version:
-                                return version
-                    except:
-                        pass
-                
-                # Try checking SCUM subdirectory
-                scum_subdir = os.path.join(steam_path, "SCUM")
-                if os.path.exists(scum_subdir):
-                    version_file = os.path.join(scum_subdir, "version.txt")
-                    if os.path.exists(version_file):
-                        try:
-                            with open(version_file, "r") as f:
-                                version = f.read().strip()
-                                if version:
-                                    return version
-                        except:
-                            pass
-                
-                # Windows: Try reading from game exe properties
-                if platform.system() == "Windows":
-                    exe_path = os.path.join(steam_path, "SCUM-Win64-Shipping.exe")
-                    if os.path.exists(exe_path):
-                        try:
-                            output = subprocess.check_output(
-                                ['powershell', '-Command', f'(Get-Item "{exe_path}").VersionInfo.ProductVersion'],
-                                stderr=subprocess.DEVNULL
-                            ).decode().strip()
-                            if output:
-                                return output
-                        except:
-                            pass
-                    
-                    # Also try the default UE4 game exe path
-                    exe_path = os.path.join(steam_path, "SCUM", "Binaries", "Win64", "SCUM.exe")
-                    if os.path.exists(exe_path):
-                        try:
-                            output = subprocess.check_output(
-                                ['powershell', '-Command', f'(Get-Item "{exe_path}").VersionInfo.ProductVersion'],
-                                stderr=subprocess.DEVNULL
-                            ).decode().strip()
-                            if output:
-                                return output
-                        except:
-                            pass
-                
-                # Linux: Try reading from executable or version metadata
-                elif platform.system() == "Linux":
-                    # Try to find Linux executable
-                    possible_exes = [
-                        os.path.join(steam_path, "SCUM-Linux-Shipping"),
-                        os.path.join(steam_path, "SCUM-Linux-Shipping.exe"),
-                        os.path.join(scum_subdir, "Binaries", "Linux", "SCUM-Linux-Shipping"),
-                        os.path.join(steam_path, "run"),
-                        os.path.join(steam_path, "start.sh"),
-                    ]
-                    
-                    for exe_path in possible_exes:
-                        if os.path.exists(exe_path):
-                            try:
-                                # Try to extract version from file metadata or strings
-                                result = subprocess.check_output(
-                                    ['strings', exe_path],
-                                    stderr=subprocess.DEVNULL
-                                ).decode()
-                                # Look for version patterns like "0.12.345" or "1.2.3.4"
-                                import re
-                                versions = re.findall(r'\b\d+\.\d+(?:\.\d+)*\b', result)
-                                # Filter for reasonable version numbers
-                                if versions:
-                                    # Return the first reasonable looking version
-                                    return versions[0]
-                            except:
-                                pass
-                    
-                    # Try checking Proton/Wine config for version info
-                    drive_c = os.path.join(steam_path, "..", "..", "drive_c", "Program Files (x86)", "SCUM")
-                    if os.path.exists(drive_c):
-                        version_file = os.path.join(drive_c, "version.txt")
-                        if os.path.exists(version_file):
-                            try:
-                                with open(version_file, "r") as f:
-                                    version = f.read().strip()
-                                    if version:
-                                        return version
-                            except:
-                                pass
+                version = self._get_version_from_files(paths, steam_path)
+                if version:
+                    return version
+            
+            # The app manifest gives the Steam build ID without starting any
+            # processes, and may point at an install folder not named SCUM
+            manifest = self._find_scum_manifest(paths)
+            steam_build_id = manifest[1].get("buildid") if manifest else None
+            if manifest and manifest[0] not in steam_paths and paths.scan(manifest[0]):
+                steam_paths.insert(0, manifest[0])
+                version = self._get_version_from_files(paths, manifest[0])
+                if version:
+                    return version
             
-            # Fall back to correlating Steam build ID if found
+            # Correlate the Steam build ID if found
             if steam_build_id:
                 version = self._correlate_steam_build_to_version(steam_build_id)
                 if version:
                     return version
             
+            # Last resort: read the version out of the game executables
+            for steam_path in steam_paths:
+                version = self._get_version_from_executables(paths, steam_path)
+                if version:
+                    return version
+            
             return "Unknown"
         except Exception as e:
             print(f"Error detecting local SCUM version: {e}")
             return "Unknown"
     
-    def _get_steam_build_id(self) -> str:
-        """Get the Steam build ID from app manifest"""
-        try:
-            import re
-            # Check common Steam library locations
-            manifest_paths = [
-                os.path.expandvars(r"%ProgramFiles(x86)%\Steam\steamapps\appmanifest_513710.acf"),
-                os.path.expandvars(r"%ProgramFiles%\Steam\steamapps\appmanifest_513710.acf"),
-                "/mnt/ct2000/SteamLibrary/steamapps/appmanifest_513710.acf",
-                os.path.expanduser("~/.steam/steamapps/appmanifest_513710.acf"),
-                os.path.expanduser("~/Steam/steamapps/appmanifest_513710.acf"),
+    def _get_version_from_files(self, paths: _StatCache, steam_path: str) -> Optional[str]:
+        """
+        Look for a version.txt in a SCUM install folder
+        
+        Args:
+            paths: Stat cache for this detection pass (steam_path already scanned)
+            steam_path: SCUM install folder
+        
+        Returns:
+            The version string, or None if no version file was found
+        """
+        # Try reading version.txt first (most reliable)
+        version = self._read_version_file(paths, os.path.join(steam_path, "version.txt"))
+        if version:
+            return version
+        
+        # Try checking SCUM subdirectory
+        scum_subdir = os.path.join(steam_path, "SCUM")
+        if paths.isdir(scum_subdir) and paths.scan(scum_subdir):
+            version = self._read_version_file(paths, os.path.join(scum_subdir, "version.txt"))
+            if version:
+                return version
+        
+        # Try checking Proton/Wine config for version info
+        if _PLATFORM == "Linux":
+            drive_c = os.path.join(steam_path, "..", "..", "drive_c", "Program Files (x86)", "SCUM")
+            if paths.exists(drive_c):
+                version = self._read_version_file(paths, os.path.join(drive_c, "version.txt"))
+                if version:
+                    return version
+        
+        return None
+    
+    def _get_version_from_executables(self, paths: _StatCache, steam_path: str) -> Optional[str]:
+        """
+        Read the version from the game executables in a SCUM install folder
+        
+        This starts PowerShell on Windows and scans whole binaries on Linux,
+        so it's only used when nothing cheaper found a version.
+        
+        Args:
+            paths: Stat cache for this detection pass (steam_path already scanned)
+            steam_path: SCUM install folder
+        
+        Returns:
+            The version string, or None if none was found
+        """
+        # Windows: Try reading from game exe properties
+        if _PLATFORM == "Windows":
+            for exe_path in (
+                os.path.join(steam_path, "SCUM-Win64-Shipping.exe"),
+                # Also try the default UE4 game exe path
+                os.path.join(steam_path, "SCUM", "Binaries", "Win64", "SCUM.exe"),
+            ):
+                if paths.exists(exe_path):
+                    try:
+                        output = subprocess.check_output(
+                            ['powershell', '-Command', f'(Get-Item "{exe_path}").VersionInfo.ProductVersion'],
+                            stderr=subprocess.DEVNULL
+                        ).decode().strip()
+                        if output:
+                            return output
+                    except:
+                        pass
+        
+        # Linux: Try reading from executable or version metadata
+        elif _PLATFORM == "Linux":
+            possible_exes = [
+                os.path.join(steam_path, "SCUM-Linux-Shipping"),
+                os.path.join(steam_path, "SCUM-Linux-Shipping.exe"),
+                os.path.join(steam_path, "SCUM", "Binaries", "Linux", "SCUM-Linux-Shipping"),
+                os.path.join(steam_path, "run"),
+                os.path.join(steam_path, "start.sh"),
             ]
             
-            for manifest_path in manifest_paths:
-                if os.path.exists(manifest_path):
-                    with open(manifest_path, 'r') as f:
-                        content = f.read()
-                        match = re.search(r'"buildid"\s*"(\d+)"', content)
-                        if match:
-                            return match.group(1)
-        except:
-            pass
+            for exe_path in possible_exes:
+                if paths.exists(exe_path):
+                    try:
+                        # Scan the file's bytes in place through a memory map
+                        # (no `strings` process, no copy of the binary)
+                        with open(exe_path, "rb") as f, \
+                                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+                                memoryview(data) as view:
+                            match = _VERSION_RE.search(view)
+                            version = match.group().decode() if match else None
+                        if version:
+                            # Return the first reasonable looking version
+                            return version
+                    except:
+                        pass
+        
         return None
     
     def _correlate_steam_build_to_version(self, build_id: str) -> str:
         """Correlate Steam build ID to known SCUM versions"""
-        # Known correlations (can be expanded as we discover more)
-        # Build ID 21005454 = Stable 1.1.0.5.101995 (as of Dec 2025)
-        build_correlations = {
-            "21005454": "1.1.0.5.101995",  # Current stable
-        }
-        
-        if build_id in build_correlations:
-            return build_correlations[build_id]
-        
         # If we don't have an exact match, return the build ID for reference
-        return f"Build {build_id}"
+        return _BUILD_CORRELATIONS.get(build_id) or f"Build {build_id}"
 
     def load_servers(self):
-        """Load servers from Battledisplay them"""
+        """Load servers from BattleMetrics in a background thread"""
+        if self.fetch_worker and self.fetch_worker.isRunning():
+            return  # Already loading
+        
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("Loading...")
+        self.status_message.setText("Loading servers...")
+        
+        self.fetch_worker = ServerFetchWorker(self.db)
+        self.fetch_worker.servers_fetched.connect(self._on_servers_fetched, Qt.ConnectionType.QueuedConnection)
+        self.fetch_worker.start()
+
+    def _on_servers_fetched(self, servers: List[GameServer]):
+        """Store fetched servers and display them"""
         self.servers = servers
+        self.server_table = ServerTable.from_servers(servers)
+        self._server_by_id = {server.id: server for server in servers}
+        self._servers_loaded = True
         self.refresh_btn.setEnabled(True)
         self.refresh_btn.setText("Refresh")
         self.status_message.setText(f"Loaded {len(servers)} servers")
@@ -1018,6 +1759,8 @@ class MainWindow(QMainWindow):
     def _update_servers(self, servers: List[GameServer]):
         """Update servers list and ping them"""
         self.servers = servers
+        self.server_table = ServerTable.from_servers(servers)
+        self._server_by_id = {server.id: server for server in servers}
         self.refresh_btn.setEnabled(True)
         self.refresh_btn.setText("Refresh")
         self.status_message.setText(f"Loaded {len(servers)} servers | Pinging...")
@@ -1036,57 +1779,39 @@ class MainWindow(QMainWindow):
         pass
     
     def _start_pinging(self):
-        """Start pinging all servers in batches"""
-        # Adjust batch size based on OS - Windows benefits from smaller batches
-        import platform
-        batch_size = 8 if platform.system() == 'Windows' else 10
-        
-        # Ping servers in batches to avoid overwhelming the system
+        """Start pinging all servers in one batched sweep"""
         self.total_pings = len(self.servers)
         self.pings_completed = 0
         
         # Start periodic display updates to show pings in real-time
         self.display_update_timer.start(250)  # Update every 250ms for smooth real-time updates
+        self.ping_flush_timer.start()
         
-        self._ping_batch(0, batch_size)
-
-    def _ping_batch(self, start_idx: int, batch_size: int):
-        """Ping a batch of servers"""
-        end_idx = min(start_idx + batch_size, len(self.servers))
-        
-        # Clean up completed workers before starting new batch (helps on Windows)
+        # Clean up completed workers (helps on Windows)
         self.ping_workers = [w for w in self.ping_workers if w.isRunning()]
         
-        for i in range(start_idx, end_idx):
-            server = self.servers[i]
-            worker = PingWorker(server)
-            worker.ping_completed.connect(self._on_ping_completed, Qt.ConnectionType.QueuedConnection)
-            worker.start()
-            self.ping_workers.append(worker)
-        
-        # Schedule next batch after a short delay if there are more servers
-        # Longer delay on Windows for better stability
-        import platform
-        delay = 150 if platform.system() == 'Windows' else 100
-        
-        if end_idx < len(self.servers):
-            QTimer.singleShot(delay, lambda: self._ping_batch(end_idx, batch_size))
+        # PingService multiplexes the connects itself, so one worker covers
+        # every server
+        worker = PingWorker(list(self.servers))
+        worker.ping_completed.connect(self._on_ping_completed, Qt.ConnectionType.QueuedConnection)
+        worker.start()
+        self.ping_workers.append(worker)
 
     def _on_ping_completed(self, server_id: str, latency: int, success: bool):
         """Handle ping completion"""
-        for server in self.servers:
-            if server.id == server_id:
-                server.latency = latency
-                server.last_ping_time = datetime.now()
-                
-                # Store in database
-                record = PingRecord(
-                    server_id=server_id,
-                    latency=latency,
-                    success=success
-                )
-                self.db.add_ping_record(record)
-                break
+        server = self._server_by_id.get(server_id)
+        if server is not None:
+            server.latency = latency
+            server.last_ping_time = datetime.now()
+            self.server_table.set_ping(server_id, latency)
+            self._pending_ping_updates.add(server_id)
+            
+            # Queue for the next batched database write
+            self._pending_ping_records.append(PingRecord(
+                server_id=server_id,
+                latency=latency,
+                success=success
+            ))
         
         self.pings_completed += 1
         
@@ -1096,47 +1821,50 @@ class MainWindow(QMainWindow):
         # When all pings are done, stop timer and do final refresh
         if self.pings_completed >= self.total_pings:
             self.display_update_timer.stop()
+            self.ping_flush_timer.stop()
+            self._flush_ping_records()  # So the history column includes this round
             self.filter_servers()  # Final update with sorting
             self.refresh_btn.setEnabled(True)
             self.refresh_btn.setText("Refresh")
             self.status_message.setText(f"Loaded {len(self.servers)} servers")
 
+    def _flush_ping_records(self):
+        """Write buffered ping records to the database in one transaction"""
+        if self._pending_ping_records:
+            records = self._pending_ping_records
+            self._pending_ping_records = []
+            self.db.add_ping_records(records)
+            self._stale_history_ids.update(record.server_id for record in records)
+
+    def _get_history_stats(self) -> dict:
+        """Get ping history stats for the table, re-querying only servers with new pings"""
+        # A full sweep leaves most servers stale, and one query beats many
+        # huge IN lists (SQLite also caps the number of parameters)
+        if self._history_stats is None or len(self._stale_history_ids) > 500:
+            self._history_stats = self.db.get_all_ping_history_stats()
+        elif self._stale_history_ids:
+            stale = list(self._stale_history_ids)
+            for server_id in stale:
+                self._history_stats.pop(server_id, None)
+            self._history_stats.update(self.db.get_all_ping_history_stats(server_ids=stale))
+        self._stale_history_ids.clear()
+        return self._history_stats
+
     def _update_displayed_pings(self):
         """Update ping values in the table without rebuilding it (for periodic updates during pinging)"""
-        # This updates ping cells in place without changing the table structure or selection
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 1)
-            if not name_item:
-                continue
-            
-            # Find the corresponding server by name
-            server_name = name_item.text()
-            server = None
-            for s in self.servers:
-                if s.name == server_name:
-                    server = s
-                    break
-            
-            if not server:
-                continue
-            
-            # Update ping column (column 3)
-            if server.latency is not None and server.latency > 0:
-                ping_text = f"{server.latency}ms"
-                ping_color = QColor("green") if server.latency < 100 else QColor("orange") if server.latency < 200 else QColor("red")
-            else:
-                ping_text = "N/A"
-                ping_color = QColor("black")
-            
-            ping_item = self.table.item(row, 3)
-            if ping_item:
-                ping_item.setText(ping_text)
-                ping_item.setForeground(ping_color)
+        # Only the ping cells of servers pinged since the last tick are
+        # repainted; the table structure, order and selection are left alone
+        updated = self._pending_ping_updates
+        self._pending_ping_updates = set()
+        self.table_model.refresh_servers(updated, 3)
 
     def _on_display_ready(self, servers: List[GameServer]):
         """Handle filtered/sorted servers from worker thread"""
-        self.display_worker = None
         self.display_servers(servers)
+        
+        if self._servers_loaded and not self._ready_emitted:
+            self._ready_emitted = True
+            self.ready.emit()
 
     def _on_table_sort(self, column: int):
         """Handle table column sorting"""
@@ -1156,21 +1884,31 @@ class MainWindow(QMainWindow):
     
     def _update_header_styling(self):
         """Bold the header of the current sort column"""
-        for col in range(self.table.columnCount()):
-            item = self.table.horizontalHeaderItem(col)
-            if item:
-                font = item.font()
-                font.setBold(col == self.table_sort_column)
-                item.setFont(font)
+        self.table_model.set_sort_column(self.table_sort_column)
+
+    def _filter_fingerprint(self) -> tuple:
+        """Current filter control values, sort and server list, for spotting no-op changes"""
+        return (
+            self.search_box.text(),
+            self.favorites_checkbox.isChecked(),
+            self.region_filter.currentText(),
+            self.max_ping.value(),
+            self.hide_empty_checkbox.isChecked(),
+            self.hide_full_checkbox.isChecked(),
+            self.table_sort_column,
+            self.table_sort_order,
+            id(self.servers),
+        )
 
     def filter_servers(self):
         """Filter servers asynchronously"""
-        # Start display worker thread
-        if self.display_worker:
-            return  # Already running
+        self._last_filter_fingerprint = self._filter_fingerprint()
         
-        self.display_worker = DisplayWorker(
+        # Hand the current state to the display worker; if a pass is already
+        # running, this becomes the next one
+        self.display_worker.submit(
             self.servers,
+            self.server_table,
             self.search_box.text().lower(),
             self.favorites_checkbox.isChecked(),
             self.region_filter.currentText(),
@@ -1178,138 +1916,58 @@ class MainWindow(QMainWindow):
             self.hide_empty_checkbox.isChecked(),
             self.hide_full_checkbox.isChecked(),
             self.table_sort_column,
-            self.table_sort_order,
-            self.db
+            self.table_sort_order
         )
-        self.display_worker.display_ready.connect(self._on_display_ready, Qt.ConnectionType.QueuedConnection)
-        self.display_worker.start()
 
     def display_servers(self, servers: List[GameServer]):
         """Display servers in table"""
-        # Load all ping history stats at once (much faster than per-server queries)
-        history_stats = self.db.get_all_ping_history_stats()
-        
-        # Sort servers based on current sort column and order
-        sort_reverse = self.table_sort_order == Qt.SortOrder.DescendingOrder
-        
-        if self.table_sort_column == 0:  # Star (favorites) - not sortable, keep current order
-            pass
-        elif self.table_sort_column == 1:  # Server Name
-            servers = sorted(servers, key=lambda s: s.name.lower(), reverse=sort_reverse)
-        elif self.table_sort_column == 2:  # Players
-            servers = sorted(servers, key=lambda s: s.players, reverse=sort_reverse)
-        elif self.table_sort_column == 3:  # Ping
-            servers = sorted(servers, key=lambda s: s.latency if s.latency else 999999, reverse=sort_reverse)
-        elif self.table_sort_column == 4:  # IP:Port - not sortable
-            pass
-        elif self.table_sort_column == 5:  # Actions - not sortable
-            pass
+        # Ping history stats, from the database only for servers pinged since the last refresh
+        history_stats = self._get_history_stats()
         
-        # Keep favorites on top - separate and recombine
-        favorites = [s for s in servers if s.is_favorite]
-        non_favorites = [s for s in servers if not s.is_favorite]
-        servers = favorites + non_favorites
-        
-        # Store SORTED servers for later reference (e.g., double-click handler)
+        # Servers arrive sorted (favorites on top) from DisplayWorker; store them
+        # for later reference (e.g., double-click handler)
         self.displayed_servers = servers
         
-        # Clear all existing rows first
-        self.table.setRowCount(0)
-        
-        # Show empty state message if no servers match filters
-        if not servers:
-            self.table.setRowCount(1)
-            empty_cell = QTableWidgetItem("No servers found. Try adjusting your search terms or filter settings.")
-            empty_cell.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_font = empty_cell.font()
-            empty_font.setItalic(True)
-            empty_cell.setFont(empty_font)
-            self.table.setItem(0, 0, empty_cell)
-            self.table.setSpan(0, 0, 1, 9)  # Span across all columns
-            self.servers_counter.setText("Servers: 0")
-            self.players_counter.setText("Players: 0")
-            return
-        
-        self.table.setRowCount(len(servers))
-        
-        for row, server in enumerate(servers):
-            try:
-                # Star button
-                star_btn = QPushButton("★" if server.is_favorite else "☆")
-                star_btn.clicked.connect(self._make_favorite_callback(server.id))
-                if server.is_favorite:
-                    # Use darker color for light theme, gold for dark theme
-                    bg_color = self.palette().color(self.backgroundRole())
-                    if bg_color.lightness() > 128:  # Light theme
-                        star_btn.setStyleSheet("color: #CC8800; font-weight: bold;")
-                    else:  # Dark theme
-                        star_btn.setStyleSheet("color: gold;")
-                self.table.setCellWidget(row, 0, star_btn)
-                
-                # Server name
-                name_item = QTableWidgetItem(server.name)
-                self.table.setItem(row, 1, name_item)
-                
-                # Players - use custom numeric item for proper sorting
-                players_item = NumericTableItem(f"{server.players}/{server.max_players}", server.players)
-                self.table.setItem(row, 2, players_item)
-                
-                # Ping - use custom numeric item for proper sorting
-                if server.latency is not None and server.latency > 0:
-                    ping_item = NumericTableItem(f"{server.latency}ms", server.latency)
-                    font = ping_item.font()
-                    font.setBold(True)
-                    ping_item.setFont(font)
-                    if server.latency < 100:
-                        ping_item.setForeground(QColor("#00AA00"))  # Bright green
-                        ping_item.setBackground(QColor(0, 170, 0, 30))  # Light green background
-                    elif server.latency < 200:
-                        ping_item.setForeground(QColor("#FF9900"))  # Orange
-                        ping_item.setBackground(QColor(255, 153, 0, 30))  # Light orange background
-                    else:
-                        ping_item.setForeground(QColor("#FF0000"))  # Red
-                        ping_item.setBackground(QColor(255, 0, 0, 30))  # Light red background
-                else:
-                    ping_item = NumericTableItem("N/A", 999999)
-                self.table.setItem(row, 3, ping_item)
-                
-                # Region - Show region continent and country code together
-                region_text = f"{server.region}"
-                if server.region in COUNTRY_TO_CONTINENT:
-                    continent = COUNTRY_TO_CONTINENT[server.region]
-                    region_text = f"{continent}: {server.region}"
-                region_item = QTableWidgetItem(region_text)
-                self.table.setItem(row, 4, region_item)
-                
-                # IP:Port
-                ip_item = QTableWidgetItem(f"{server.ip}:{server.port}")
-                self.table.setItem(row, 5, ip_item)
-                
-                # History - Show ping history stats (clickable to see full graph)
-                history_widget = self._create_history_widget_from_stats(server.id, server.name, history_stats.get(server.id))
-                self.table.setCellWidget(row, 6, history_widget)
-            except Exception as e:
-                print(f"Error populating row {row}: {e}")
-                import traceback
-                traceback.print_exc()
+        # The model reads cells straight from the servers, so this is a single
+        # reset; updates are held off so it and the span change paint once
+        self.table.setUpdatesEnabled(False)
+        try:
+            bg_color = self.palette().color(self.backgroundRole())
+            self.table_model.set_servers(servers, history_stats, light_theme=bg_color.lightness() > 128)
+            
+            # Show empty state message across all columns if no servers match filters
+            self.table.clearSpans()
+            if not servers:
+                self.table.setSpan(0, 0, 1, self.table_model.columnCount())
+        finally:
+            self.table.setUpdatesEnabled(True)
         
         # Update counters in bottom right
-        total_servers = self.table.rowCount()
         total_players = sum(server.players for server in servers)
-        self.servers_counter.setText(f"Servers: {total_servers}")
+        self.servers_counter.setText(f"Servers: {len(servers)}")
         self.players_counter.setText(f"Players: {total_players}")
 
+    def _on_table_click(self, index):
+        """Toggle favorites from the star column and open history from the history column"""
+        server = self.table_model.server_at(index.row())
+        if server is None:
+            return
+        if index.column() == 0:
+            self.toggle_favorite(server.id)
+        elif index.column() == 6 and self.table_model.has_history(server.id):
+            self.show_history(server.id, server.name)
+
     def toggle_favorite(self, server_id: str):
         """Toggle favorite status for a server"""
-        for server in self.servers:
-            if server.id == server_id:
-                if server.is_favorite:
-                    self.db.remove_favorite(server_id)
-                    server.is_favorite = False
-                else:
-                    self.db.add_favorite(server_id, server.name)
-                    server.is_favorite = True
-                break
+        server = self._server_by_id.get(server_id)
+        if server is not None:
+            if server.is_favorite:
+                self.db.remove_favorite(server_id)
+                server.is_favorite = False
+            else:
+                self.db.add_favorite(server_id, server.name)
+                server.is_favorite = True
+            self.server_table.set_favorite(server_id, server.is_favorite)
         
         self.filter_servers()
 
@@ -1372,78 +2030,18 @@ class MainWindow(QMainWindow):
         widget.setLayout(layout)
         return widget
 
-    def _create_history_widget_from_stats(self, server_id: str, server_name: str, stats: dict) -> QWidget:
-        """Create a clickable history preview widget using cached stats (fast)"""
-        widget = QWidget()
-        layout = QVBoxLayout()
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(0)
-        
-        if stats:
-            min_lat = stats['min']
-            max_lat = stats['max']
-            avg_lat = stats['avg']
-            last_timestamp = stats.get('last_timestamp')
-            
-            # Helper function to get color based on latency
-            def get_color_hex(lat):
-                if lat < 100:
-                    return "#00AA00"  # Green
-                elif lat < 200:
-                    return "#FF9900"  # Orange
-                else:
-                    return "#FF0000"  # Red
-            
-            # Calculate time since last ping (only if needed for display)
-            time_ago = ""
-            if last_timestamp:
-                delta = datetime.now() - last_timestamp
-                seconds = delta.total_seconds()
-                if seconds < 60:
-                    time_ago = f"{int(seconds)}s"
-                elif seconds < 3600:
-                    time_ago = f"{int(seconds / 60)}m"
-                else:
-                    time_ago = f"{int(seconds / 3600)}h"
-            
-            # Create simpler HTML - combine stats and time on one line
-            preview_html = f'<span style="color: {get_color_hex(min_lat)};">{min_lat}</span>/' \
-                          f'<span style="color: {get_color_hex(max_lat)};">{max_lat}</span>/' \
-                          f'<span style="color: {get_color_hex(avg_lat)};">{avg_lat:.0f}ms</span>'
-            if time_ago:
-                preview_html += f' <span style="color: #888;">({time_ago})</span>'
-            
-            label = QLabel(preview_html)
-            label.setStyleSheet("font-size: 8px; padding: 1px;")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setCursor(Qt.CursorShape.PointingHandCursor)
-            label.mousePressEvent = lambda e: self.show_history(server_id, server_name)
-            layout.addWidget(label)
-        else:
-            label = QLabel("No data")
-            label.setStyleSheet("font-size: 8px; padding: 1px;")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(label)
-        
-        widget.setLayout(layout)
-        return widget
-
     def _make_history_callback(self, server: GameServer):
         """Create a callback for the history button that captures the correct server"""
         def callback():
             self.show_history(server.id, server.name)
         return callback
 
-    def _make_favorite_callback(self, server_id: str):
-        """Create a callback for the favorite button that captures the correct server ID"""
-        def callback():
-            self.toggle_favorite(server_id)
-        return callback
-
     def ping_single_server(self, server: GameServer):
         """Ping a single server"""
         result = PingService.ping_server(server.ip, server.port)
         server.latency = result.latency if result.latency > 0 else 0
+        if self.server_table is not None:
+            self.server_table.set_ping(server.id, server.latency)
         
         record = PingRecord(
             server_id=server.id,
@@ -1451,18 +2049,68 @@ class MainWindow(QMainWindow):
             success=result.success
         )
         self.db.add_ping_record(record)
+        self._stale_history_ids.add(server.id)
         self.filter_servers()
 
+    def _get_ping_graph(self):
+        """
+        Get the history graph, building it on first use
+        
+        Returns:
+            (Figure, Axes, latency Line2D, failed ping PathCollection, FigureCanvas)
+        """
+        if self._ping_fig is None:
+            # matplotlib is only imported once a graph is shown, keeping it
+            # out of application startup
+            import matplotlib
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.figure import Figure
+            import matplotlib.dates as mdates
+            
+            # Let Agg drop sub-pixel segments and rasterize long paths in
+            # chunks; the graph is an on-screen preview, not an export
+            matplotlib.rcParams.update({
+                "path.simplify": True,
+                "path.simplify_threshold": 1.0,
+                "agg.path.chunksize": 10000,
+            })
+            
+            # The tight layout is redone on each draw, at the canvas's current size
+            self._ping_fig = Figure(figsize=(8, 5), dpi=80, layout='tight')
+            self._ping_ax = self._ping_fig.add_subplot(111)
+            self._ping_line, = self._ping_ax.plot([], [], linestyle='-', linewidth=2, markersize=8)
+            self._ping_failed = self._ping_ax.scatter([], [], marker='x', s=100, color='red',
+                                                      label='Failed Pings', zorder=5, linewidths=2)
+            self._ping_ax.xaxis_date()
+            self._ping_ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+            self._ping_canvas = FigureCanvas(self._ping_fig)
+        return self._ping_fig, self._ping_ax, self._ping_line, self._ping_failed, self._ping_canvas
+    
+    def _get_history_dialog(self) -> QDialog:
+        """
+        Get the ping history dialog, building it on first use
+        
+        The graph canvas is added by show_history once there's a graph to show;
+        the message box below it is used when there isn't.
+        """
+        if self._history_dialog is None:
+            self._history_dialog = QDialog(self)
+            layout = QVBoxLayout()
+            self._history_message = QTextEdit()
+            self._history_message.setReadOnly(True)
+            layout.addWidget(self._history_message)
+            self._history_dialog.setLayout(layout)
+        return self._history_dialog
+    
     def show_history(self, server_id: str, server_name: str):
         """Show ping history for a server as a line graph"""
         history = self.db.get_ping_history(server_id)
         
-        dialog = QDialog(self)
+        dialog = self._get_history_dialog()
         dialog.setWindowTitle(f"Ping History - {server_name}")
         dialog.setGeometry(200, 200, 700, 500)
         
-        layout = QVBoxLayout()
-        
+        message = None  # Shown instead of the graph when set
         try:
             if history:
                 # Extract all records including failed pings
@@ -1483,27 +2131,17 @@ class MainWindow(QMainWindow):
                 # but matplotlib needs chronological order (oldest to newest)
                 all_timestamps.reverse()
                 all_latencies.reverse()
+                failed_timestamps.reverse()
                 
                 # Get successful pings for plotting the line
                 timestamps = [t for t, lat in zip(all_timestamps, all_latencies) if lat is not None]
                 latencies = [lat for lat in all_latencies if lat is not None]
                 
                 if latencies:
-                    # Create figure and plot line graph
-                    fig = Figure(figsize=(8, 5), dpi=100)
-                    ax = fig.add_subplot(111)
+                    fig, ax, line, failed, canvas = self._get_ping_graph()
                     
                     # Get theme colors based on current theme
-                    if self.theme_service.current_theme == Theme.LIGHT:
-                        is_dark = False
-                    elif self.theme_service.current_theme == Theme.DARK:
-                        is_dark = True
-                    else:  # SYSTEM
-                        try:
-                            import darkdetect
-                            is_dark = darkdetect.isDark()
-                        except Exception:
-                            is_dark = False
+                    is_dark = self.theme_service.is_dark()
                     
                     # Set figure and axes background colors based on theme
                     if is_dark:
@@ -1520,52 +2158,66 @@ class MainWindow(QMainWindow):
                     fig.patch.set_facecolor(fig_bg_color)
                     ax.set_facecolor(ax_bg_color)
                     
+                    # Latency bounds for the failed ping markers and y-axis
+                    latency_array = np.asarray(latencies)
+                    min_latency = int(latency_array.min())
+                    max_latency = int(latency_array.max())
+                    
                     # Apply moving average to smooth the data with larger window
+                    # (window sums from one prefix sum, shrinking at the ends)
                     window_size = max(10, len(latencies) // 15)  # Larger window for smoother curve
-                    averaged_latencies = []
-                    for i in range(len(latencies)):
-                        start = max(0, i - window_size // 2)
-                        end = min(len(latencies), i + window_size // 2 + 1)
-                        avg = sum(latencies[start:end]) / (end - start)
-                        averaged_latencies.append(avg)
+                    prefix = np.concatenate(([0.0], np.cumsum(latency_array, dtype=float)))
+                    positions = np.arange(len(latencies))
+                    start = np.maximum(0, positions - window_size // 2)
+                    end = np.minimum(len(latencies), positions + window_size // 2 + 1)
+                    averaged_latencies = (prefix[end] - prefix[start]) / (end - start)
                     
                     # Convert timestamps to matplotlib date numbers for x-axis
                     import matplotlib.dates as mdates
-                    from scipy.interpolate import UnivariateSpline
                     x = mdates.date2num(timestamps)
-                    y = np.array(averaged_latencies)
+                    y = averaged_latencies
+                    
+                    # Pings recorded in the same instant would give the curve a
+                    # zero-width interval, so keep the first of each
+                    distinct = np.concatenate(([True], np.diff(x) > 0))
                     
-                    # Use UnivariateSpline with smoothing parameter for less jittery curves
-                    if len(averaged_latencies) >= 4:
-                        # Smoothing parameter: higher = smoother (0 = interpolation, no smoothing)
-                        s = len(averaged_latencies) * 0.5  # Adaptive smoothing
-                        spl = UnivariateSpline(x, y, s=s, k=3)
-                        x_smooth = np.linspace(x.min(), x.max(), 300)
-                        y_smooth = spl(x_smooth)
-                        ax.plot(x_smooth, y_smooth, linestyle='-', linewidth=2, color=line_color)
-                    elif len(averaged_latencies) >= 3:
-                        # Use quadratic spline for fewer points
-                        s = len(averaged_latencies) * 0.3
-                        spl = UnivariateSpline(x, y, s=s, k=2)
-                        x_smooth = np.linspace(x.min(), x.max(), 100)
-                        y_smooth = spl(x_smooth)
-                        ax.plot(x_smooth, y_smooth, linestyle='-', linewidth=2, color=line_color)
+                    line.set_color(line_color)
+                    if np.count_nonzero(distinct) >= 3:
+                        # Draw a smooth monotone cubic through the averaged points
+                        x_curve, y_curve = x[distinct], y[distinct]
+                        # A few samples per point is already smooth at dialog size
+                        num_samples = max(60, min(300, 4 * len(x_curve)))
+                        x_smooth = np.linspace(x_curve[0], x_curve[-1], num_samples)
+                        y_smooth = _monotone_cubic(x_curve, y_curve, x_smooth)
+                        line.set_data(x_smooth, y_smooth)
+                        line.set_marker('None')
                     else:
                         # For 1-2 points, just plot raw data with markers
-                        ax.plot(x, y, marker='o', linestyle='-', linewidth=2, markersize=8, color=line_color)
+                        line.set_data(x, y)
+                        line.set_marker('o')
                     
                     # Add markers for failed pings
+                    # Both time series are sorted, so their ends bound the x-axis
+                    x_min, x_max = x[0], x[-1]
                     if failed_timestamps:
                         failed_x = mdates.date2num(failed_timestamps)
                         # Place markers at the top of the y-axis range
-                        failed_y = [max(latencies) * 1.1] * len(failed_x)
-                        ax.scatter(failed_x, failed_y, marker='x', s=100, color='red', 
-                                 label='Failed Pings', zorder=5, linewidths=2)
-                        ax.legend(loc='upper right', fontsize=9)
+                        failed_y = np.full(len(failed_x), max_latency * 1.1)
+                        failed.set_offsets(np.column_stack((failed_x, failed_y)))
+                        x_min, x_max = min(x_min, failed_x[0]), max(x_max, failed_x[-1])
+                    else:
+                        failed.set_offsets(np.empty((0, 2)))
+                    legend = ax.get_legend()
+                    if failed_timestamps and legend is None:
+                        ax.legend(handles=[failed], loc='upper right', fontsize=9)
+                    elif legend is not None:
+                        legend.set_visible(bool(failed_timestamps))
+                    
+                    # Fit the x-axis to the new data (with matplotlib's usual 5% margin)
+                    x_margin = (x_max - x_min) * 0.05 or 1 / 24  # An hour either side of one point
+                    ax.set_xlim(x_min - x_margin, x_max + x_margin)
                     
                     # Normalize y-axis so small variations don't create drastic jumps
-                    min_latency = min(latencies)
-                    max_latency = max(latencies)
                     latency_range = max_latency - min_latency
                     # Add 20% padding on both sides for better visualization
                     padding = max(latency_range * 0.2, 5)  # At least 5ms padding
@@ -1578,7 +2230,6 @@ class MainWindow(QMainWindow):
                     ax.grid(True, alpha=0.3, color=text_color)
                     
                     # Format x-axis to show timestamps
-                    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
                     fig.autofmt_xdate()  # Auto-rotate date labels for better readability
                     
                     # Style axis ticks and spines
@@ -1586,29 +2237,25 @@ class MainWindow(QMainWindow):
                     for spine in ax.spines.values():
                         spine.set_edgecolor(text_color)
                     
-                    fig.tight_layout()
-                    
-                    # Embed matplotlib figure in PyQt6
-                    canvas = FigureCanvas(fig)
-                    layout.addWidget(canvas)
+                    # The canvas joins the dialog the first time a graph is shown
+                    if canvas.parent() is not dialog:
+                        dialog.layout().addWidget(canvas)
+                    canvas.draw_idle()
                 else:
-                    text_edit = QTextEdit()
-                    text_edit.setReadOnly(True)
-                    text_edit.setText("No successful ping records available")
-                    layout.addWidget(text_edit)
+                    message = "No successful ping records available"
             else:
-                text_edit = QTextEdit()
-                text_edit.setReadOnly(True)
-                text_edit.setText("No ping history available")
-                layout.addWidget(text_edit)
+                message = "No ping history available"
         
         except Exception as e:
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setText(f"Error displaying graph: {str(e)}\n\nPlease check if matplotlib is properly installed.")
-            layout.addWidget(text_edit)
+            message = f"Error displaying graph: {str(e)}\n\nPlease check if matplotlib is properly installed."
+        
+        # Show either the graph or the message
+        if self._ping_canvas is not None:
+            self._ping_canvas.setVisible(message is None)
+        self._history_message.setVisible(message is not None)
+        if message is not None:
+            self._history_message.setText(message)
         
-        dialog.setLayout(layout)
         dialog.exec()
 
     def toggle_auto_refresh(self, state):
@@ -1621,9 +2268,116 @@ class MainWindow(QMainWindow):
             self.refresh_timer.stop()
             self.auto_refresh_checkbox.stop_spin()
 
+    @classmethod
+    def _get_connection_guide_pixmap(cls) -> QPixmap:
+        """
+        Get the connection guide screenshot, loading and scaling it on first use
+        
+        Returns:
+            The screenshot (at most 300px wide), or a null pixmap if it's missing
+        """
+        if cls._connection_guide_pixmap is None:
+            # The bundled 300px copy needs no scaling
+            if os.path.exists(_CONNECTION_GUIDE_300_PATH):
+                pixmap = QPixmap(_CONNECTION_GUIDE_300_PATH)
+            elif os.path.exists(_CONNECTION_GUIDE_PATH):
+                pixmap = QPixmap(_CONNECTION_GUIDE_PATH)
+            else:
+                pixmap = QPixmap()
+            # Scale to fit nicely in dialog (max 300px width)
+            if pixmap.width() > 300:
+                pixmap = pixmap.scaledToWidth(300, Qt.TransformationMode.SmoothTransformation)
+            cls._connection_guide_pixmap = pixmap
+        return cls._connection_guide_pixmap
+    
+    def _get_connect_dialog(self) -> QDialog:
+        """
+        Get the connection dialog, building it on first use
+        
+        The dialog is reused for every server; _on_table_double_click only
+        updates the server name and address labels before showing it.
+        """
+        if self._connect_dialog is not None:
+            return self._connect_dialog
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Connect to Server")
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setSpacing(6)
+        
+        # Header: Server name
+        title_label = QLabel()
+        title_label.setFont(self._connection_title_font)
+        title_label.setStyleSheet("margin: 0px; padding: 0px; line-height: 1.2;")
+        main_layout.addWidget(title_label)
+        
+        # Sub-header: Address
+        address_label = QLabel()
+        address_label.setFont(self._connection_text_font)
+        address_label.setStyleSheet("margin: 0px; padding: 0px; line-height: 1.2;")
+        main_layout.addWidget(address_label)
+        
+        # Content row: Instructions on left, image on right
+        content_layout = QHBoxLayout()
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(10)
+        
+        # Instructions (left side)
+        instructions_label = QLabel(
+            "<b>STEPS TO JOIN:</b><br>"
+            "1. <b>Click 'Launch SCUM'</b> button below<br>"
+            "2. <b>Wait</b> for SCUM to load to main menu<br>"
+            "3. <b>Click 'MULTI PLAY'</b><br>"
+            "4. <b><span style='color: #4CAF50;'>Paste</span></b> the server address (Ctrl+V)<br>"
+            "5. <b>Click '<span style='color: #F44336;'>CONNECT</span>'</b>"
+        )
+        instructions_label.setFont(self._connection_text_font)
+        instructions_label.setStyleSheet("margin: 0px; padding: 0px; line-height: 1.2;")
+        instructions_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        content_layout.addWidget(instructions_label, 1)
+        
+        # Screenshot (right side)
+        pixmap = self._get_connection_guide_pixmap()
+        if not pixmap.isNull():
+            screenshot_label = QLabel()
+            screenshot_label.setStyleSheet("margin: 0px; padding: 0px;")
+            screenshot_label.setPixmap(pixmap)
+            screenshot_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignCenter)
+            content_layout.addWidget(screenshot_label, 0)
+        
+        main_layout.addLayout(content_layout)
+        
+        # Buttons (bottom)
+        button_layout = QHBoxLayout()
+        button_layout.setContentsMargins(0, 0, 0, 0)
+        launch_btn = QPushButton("Launch SCUM")
+        close_btn = QPushButton("Close")
+        button_layout.addStretch()
+        button_layout.addWidget(launch_btn)
+        button_layout.addWidget(close_btn)
+        main_layout.addLayout(button_layout)
+        
+        dialog.setLayout(main_layout)
+        
+        # Connect buttons
+        launch_btn.clicked.connect(self._on_connect_launch)
+        close_btn.clicked.connect(dialog.reject)
+        
+        self._connect_dialog = dialog
+        self._connect_title_label = title_label
+        self._connect_address_label = address_label
+        return dialog
+    
+    def _on_connect_launch(self):
+        """Launch SCUM from the connection dialog"""
+        self._launch_scum()
+        self._connect_dialog.accept()
+        self.statusBar().showMessage(f"✓ SCUM launching... Paste {self._connect_server_info} in MULTIPLAYER > CONNECT")
+    
     def _on_table_double_click(self):
         """Handle double-click on table row - show instructions and offer to launch SCUM"""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             return
         
@@ -1633,113 +2387,37 @@ class MainWindow(QMainWindow):
             server_info = f"{server.ip}:{server.port}"
             
             # Copy to clipboard
-            clipboard = QApplication.clipboard()
-            clipboard.setText(server_info)
+            self._clipboard.setText(server_info)
             
-            # Create custom dialog with screenshot
-            dialog = QDialog(self)
-            dialog.setWindowTitle("Connect to Server")
-            main_layout = QVBoxLayout()
-            main_layout.setContentsMargins(10, 10, 10, 10)
-            main_layout.setSpacing(6)
-            
-            # Header: Server name
-            title_label = QLabel(f"<b>{server.name}</b>")
-            title_font = QFont()
-            title_font.setPointSize(12)
-            title_font.setWeight(700)
-            title_label.setFont(title_font)
-            title_label.setStyleSheet("margin: 0px; padding: 0px; line-height: 1.2;")
-            main_layout.addWidget(title_label)
-            
-            # Sub-header: Address
-            address_label = QLabel(f"<b>Address:</b> <span style='color: #2196F3; font-family: monospace;'>{server_info}</span> (copied to clipboard)")
-            address_font = QFont()
-            address_font.setPointSize(10)
-            address_label.setFont(address_font)
-            address_label.setStyleSheet("margin: 0px; padding: 0px; line-height: 1.2;")
-            main_layout.addWidget(address_label)
-            
-            # Content row: Instructions on left, image on right
-            content_layout = QHBoxLayout()
-            content_layout.setContentsMargins(0, 0, 0, 0)
-            content_layout.setSpacing(10)
-            
-            # Instructions (left side)
-            instructions_label = QLabel(
-                "<b>STEPS TO JOIN:</b><br>"
-                "1. <b>Click 'Launch SCUM'</b> button below<br>"
-                "2. <b>Wait</b> for SCUM to load to main menu<br>"
-                "3. <b>Click 'MULTI PLAY'</b><br>"
-                "4. <b><span style='color: #4CAF50;'>Paste</span></b> the server address (Ctrl+V)<br>"
-                "5. <b>Click '<span style='color: #F44336;'>CONNECT</span>'</b>"
-            )
-            instructions_font = QFont()
-            instructions_font.setPointSize(10)
-            instructions_label.setFont(instructions_font)
-            instructions_label.setStyleSheet("margin: 0px; padding: 0px; line-height: 1.2;")
-            instructions_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-            content_layout.addWidget(instructions_label, 1)
-            
-            # Screenshot (right side)
-            ui_dir = os.path.dirname(__file__)  # scum_tracker/ui
-            assets_path = os.path.join(ui_dir, "..", "assets", "connection_guide.png")
-            assets_path = os.path.normpath(assets_path)
-            if os.path.exists(assets_path):
-                screenshot_label = QLabel()
-                screenshot_label.setStyleSheet("margin: 0px; padding: 0px;")
-                pixmap = QPixmap(assets_path)
-                # Scale to fit nicely in dialog (max 300px width)
-                if pixmap.width() > 300:
-                    pixmap = pixmap.scaledToWidth(300, Qt.TransformationMode.SmoothTransformation)
-                screenshot_label.setPixmap(pixmap)
-                screenshot_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignCenter)
-                content_layout.addWidget(screenshot_label, 0)
-            
-            main_layout.addLayout(content_layout)
-            
-            # Buttons (bottom)
-            button_layout = QHBoxLayout()
-            button_layout.setContentsMargins(0, 0, 0, 0)
-            launch_btn = QPushButton("Launch SCUM")
-            close_btn = QPushButton("Close")
-            button_layout.addStretch()
-            button_layout.addWidget(launch_btn)
-            button_layout.addWidget(close_btn)
-            main_layout.addLayout(button_layout)
-            
-            dialog.setLayout(main_layout)
+            # Fill the connection dialog in for this server
+            dialog = self._get_connect_dialog()
+            self._connect_server_info = server_info
+            self._connect_title_label.setText(f"<b>{server.name}</b>")
+            self._connect_address_label.setText(f"<b>Address:</b> <span style='color: #2196F3; font-family: monospace;'>{server_info}</span> (copied to clipboard)")
             dialog.resize(800, 400)
             
-            # Connect buttons
-            def on_launch():
-                self._launch_scum()
-                dialog.accept()
-                self.statusBar().showMessage(f"✓ SCUM launching... Paste {server_info} in MULTIPLAYER > CONNECT")
-            
-            launch_btn.clicked.connect(on_launch)
-            close_btn.clicked.connect(dialog.reject)
-            
             dialog.exec()
     
     def _launch_scum(self):
         """Launch SCUM game via Steam"""
+        # Both calls hand off to the OS and return without waiting for the
+        # launcher, so the event loop doesn't stall while Steam starts
+        steam_url = f"steam://run/{self.SCUM_APP_ID}"
         try:
-            if platform.system() == "Linux":
-                # Try steam command first
-                try:
-                    subprocess.Popen(["steam", "steam://run/513710"],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                except FileNotFoundError:
-                    # Fallback to xdg-open
-                    subprocess.Popen(["xdg-open", "steam://run/513710"],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-            elif platform.system() == "Windows":
-                subprocess.Popen("steam://run/513710")
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.Popen(["open", "steam://run/513710"])
+            if _PLATFORM == "Linux":
+                # Try steam command first (its console output is discarded)
+                process = QProcess()
+                process.setProgram("steam")
+                process.setArguments([steam_url])
+                process.setStandardOutputFile(QProcess.nullDevice())
+                process.setStandardErrorFile(QProcess.nullDevice())
+                launched, _ = process.startDetached()
+                if launched:
+                    return
+            # Otherwise open the URL with the desktop's handler (xdg-open on
+            # Linux, the shell on Windows, open on macOS)
+            if not QDesktopServices.openUrl(QUrl(steam_url)):
+                self.statusBar().showMessage("Error launching SCUM: no handler for steam:// URLs")
         except Exception as e:
             self.statusBar().showMessage(f"Error launching SCUM: {e}")
 